@@ -1,17 +1,30 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
-import sys
-import io
+from pathlib import PurePosixPath
+import orjson
 import os
-from contextlib import redirect_stdout
+from contextlib import asynccontextmanager
 
 # Import our CLI logic
 from nfl_stats.main import process_query
+from nfl_stats.api import close_session
+from nfl_stats.data import warm_reference_data
+from nfl_stats.utils import create_recording_console
 
-app = FastAPI(title="NFL Stats API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the player/draft databases on startup; release the HTTP pool on shutdown."""
+    await run_in_threadpool(warm_reference_data)
+    yield
+    close_session()
+
+# No custom default_response_class: routes with a response_model are serialized straight to
+# JSON bytes by pydantic-core, which is as fast as orjson and skips the jsonable_encoder pass
+app = FastAPI(title="NFL Stats API", version="1.0.0", lifespan=lifespan)
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -22,8 +35,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-from nfl_stats.utils import console
-
 class QueryRequest(BaseModel):
     query: str
     
@@ -37,20 +48,24 @@ class QueryResponse(BaseModel):
     is_longest_play: bool = False
     data: Optional[Dict[str, Any]] = None
 
+_ROOT_JSON = orjson.dumps({
+    "message": "NFL Stats API",
+    "version": "1.0.0",
+    "endpoints": {
+        "POST /api/query": "Process natural language NFL stats query",
+        "GET /api/health": "Health check"
+    }
+})
+
+_HEALTH_JSON = orjson.dumps({"status": "healthy"})
+
 @app.get("/")
 async def root():
-    return {
-        "message": "NFL Stats API",
-        "version": "1.0.0",
-        "endpoints": {
-            "POST /api/query": "Process natural language NFL stats query",
-            "GET /api/health": "Health check"
-        }
-    }
+    return Response(_ROOT_JSON, media_type="application/json")
 
 @app.get("/api/health")
 async def health():
-    return {"status": "healthy"}
+    return Response(_HEALTH_JSON, media_type="application/json")
 
 @app.post("/api/query", response_model=QueryResponse)
 async def query_stats(request: QueryRequest):
@@ -63,40 +78,17 @@ async def query_stats(request: QueryRequest):
     - "lamar jackson rookie year"
     """
     try:
-        # Clear previous capture
-        console.clear()
-        console.export_text(clear=True) 
+        # Per-request console so concurrent queries never share a capture buffer
+        console = create_recording_console()
         
         # Check if this is a longest play query
         is_longest = any(word in request.query.lower() for word in ['longest', 'biggest', 'furthest'])
         
-        # Process the query using our CLI logic
-        import glob
-        import os
-        import time
-        
-        # Get the directory where animations are saved (project root)
-        project_root = os.path.dirname(os.path.abspath(__file__))
-        animation_pattern = os.path.join(project_root, "play_animation_*.gif")
-        
-        # Get list of existing animation files before query
-        before_files = set(glob.glob(animation_pattern))
-        before_time = time.time()
-        
-        result_data = process_query(request.query, use_spinner=False)
-        
-        # Get list of animation files after query
-        after_files = set(glob.glob(animation_pattern))
-        
-        # Find new animation file (created after query started)
-        new_files = []
-        for file in after_files:
-            if file not in before_files:
-                # Check if file was created recently (within last 30 seconds)
-                if os.path.getmtime(file) > before_time:
-                    new_files.append(os.path.basename(file))
+        # process_query is blocking I/O; run it off the event loop
+        result_data = await run_in_threadpool(process_query, request.query, use_spinner=False, console=console)
         
-        animation_path = new_files[0] if new_files else None
+        # The longest-play branch reports the animation file it produced
+        animation_path = (result_data or {}).get("animation_path")
         
         # Get the captured output as HTML
         html_output = console.export_html(
@@ -125,65 +117,80 @@ async def query_stats(request: QueryRequest):
             is_longest_play=False
         )
 
+_EXAMPLES_JSON = orjson.dumps({
+    "examples": [
+        {
+            "category": "Comparisons",
+            "queries": [
+                "patrick mahomes vs josh allen 2024",
+                "lamar jackson vs joe burrow 2023",
+                "derrick henry vs saquon barkley"
+            ]
+        },
+        {
+            "category": "Player Stats",
+            "queries": [
+                "josh allen 2024",
+                "tom brady patriots",
+                "lamar jackson rookie year"
+            ]
+        },
+        {
+            "category": "Longest Plays",
+            "queries": [
+                "longest catch by justin jefferson",
+                "longest run by saquon barkley",
+                "longest pass by patrick mahomes"
+            ]
+        },
+        {
+            "category": "Playoffs",
+            "queries": [
+                "patrick mahomes playoffs",
+                "tom brady super bowl",
+                "lamar jackson playoffs bills"
+            ]
+        },
+        {
+            "category": "News",
+            "queries": [
+                "joe burrow injuries",
+                "travis kelce news"
+            ]
+        }
+    ]
+})
+
 @app.get("/api/examples")
 async def get_examples():
     """Return example queries for the frontend."""
-    return {
-        "examples": [
-            {
-                "category": "Comparisons",
-                "queries": [
-                    "patrick mahomes vs josh allen 2024",
-                    "lamar jackson vs joe burrow 2023",
-                    "derrick henry vs saquon barkley"
-                ]
-            },
-            {
-                "category": "Player Stats",
-                "queries": [
-                    "josh allen 2024",
-                    "tom brady patriots",
-                    "lamar jackson rookie year"
-                ]
-            },
-            {
-                "category": "Longest Plays",
-                "queries": [
-                    "longest catch by justin jefferson",
-                    "longest run by saquon barkley",
-                    "longest pass by patrick mahomes"
-                ]
-            },
-            {
-                "category": "Playoffs",
-                "queries": [
-                    "patrick mahomes playoffs",
-                    "tom brady super bowl",
-                    "lamar jackson playoffs bills"
-                ]
-            },
-            {
-                "category": "News",
-                "queries": [
-                    "joe burrow injuries",
-                    "travis kelce news"
-                ]
-            }
-        ]
-    }
+    return Response(_EXAMPLES_JSON, media_type="application/json")
 
 @app.get("/api/animation/{filename}")
-async def get_animation(filename: str):
+async def get_animation(filename: str, request: Request):
     """Serve animation GIF files."""
-    file_path = os.path.join(os.getcwd(), filename)
-    
-    if not os.path.exists(file_path):
+    # Only bare .gif names from the working directory; reject anything path-like before touching disk
+    if PurePosixPath(filename).name != filename or filename in ('.', '..'):
         raise HTTPException(status_code=404, detail="Animation not found")
     
     if not filename.endswith('.gif'):
         raise HTTPException(status_code=400, detail="Invalid file type")
     
-    return FileResponse(file_path, media_type="image/gif")
+    file_path = os.path.join(os.getcwd(), filename)
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        raise HTTPException(status_code=404, detail="Animation not found")
+    
+    # Animations are regenerated under the same name, so clients revalidate rather than cache blindly
+    headers = {
+        "Cache-Control": "public, no-cache",
+        "ETag": f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    
+    return FileResponse(file_path, media_type="image/gif", stat_result=stat, headers=headers)
 
 if __name__ == "__main__":
     import uvicorn
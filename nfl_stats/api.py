@@ -1,8 +1,265 @@
+import functools
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import quote
+
+import orjson
 import requests
-from typing import Dict, Optional, Any, List
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Any, List, Tuple
 
 ESPN_BASE_URL = "http://site.api.espn.com/apis/site/v2/sports/football/nfl"
 COMMON_API_URL = "http://site.api.espn.com/apis/common/v3"
+DEFAULT_TIMEOUT = 10
+
+# NFL.com honors page patterns: "AP <award> ...\n <Winner Name>"
+_NFLCOM_WINNER = r'[^\n]*\n\s*([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)'
+_NFLCOM_AWARD_PATTERNS = [
+    (re.compile(r'AP\s+Most\s+Valuable\s+Player' + _NFLCOM_WINNER, re.IGNORECASE), 'Most Valuable Player'),
+    (re.compile(r'AP\s+Offensive\s+Player\s+of\s+the\s+Year' + _NFLCOM_WINNER, re.IGNORECASE), 'Offensive Player of the Year'),
+    (re.compile(r'AP\s+Defensive\s+Player\s+of\s+the\s+Year' + _NFLCOM_WINNER, re.IGNORECASE), 'Defensive Player of the Year'),
+    (re.compile(r'AP\s+Offensive\s+Rookie\s+of\s+the\s+Year' + _NFLCOM_WINNER, re.IGNORECASE), 'Offensive Rookie of the Year'),
+    (re.compile(r'AP\s+Defensive\s+Rookie\s+of\s+the\s+Year' + _NFLCOM_WINNER, re.IGNORECASE), 'Defensive Rookie of the Year'),
+    (re.compile(r'AP\s+Comeback\s+Player\s+of\s+the\s+Year' + _NFLCOM_WINNER, re.IGNORECASE), 'Comeback Player of the Year'),
+]
+_WHITESPACE_RE = re.compile(r'\s+')
+_CITATION_RE = re.compile(r'\[.*?\]')
+
+# Parse only the parts of Wikipedia pages the scrapers actually read
+try:
+    from bs4 import SoupStrainer
+    _SEASON_AWARDS_STRAINER = SoupStrainer(['h2', 'h3', 'table'])
+    _INFOBOX_STRAINER = SoupStrainer(class_='infobox')
+except ImportError:
+    _SEASON_AWARDS_STRAINER = _INFOBOX_STRAINER = None
+
+# Wikipedia pages are fetched from the REST API and cached on disk (ETag-revalidated)
+WIKI_REST_URL = "https://en.wikipedia.org/api/rest_v1/page/html"
+WIKI_CACHE_DIR = Path.home() / ".nfl_stats_cache" / "wiki"
+WIKI_CACHE_MAX_AGE = 7 * 86400
+WIKI_HEADERS = {"User-Agent": "nfl-stats/1.0 (https://github.com/shivaansh74/nfl-stats)"}
+
+# ESPN JSON that is worth keeping across runs (gamelogs, leaders, athlete/team refs)
+# is cached on disk and revalidated with ETag/Last-Modified once stale
+HTTP_CACHE_DIR = Path.home() / ".nfl_stats_cache" / "http"
+LEADERS_MAX_AGE = 3600
+ATHLETE_REF_MAX_AGE = 7 * 86400
+
+# Response cache settings: current-season data changes during the week,
+# past seasons are effectively immutable.
+CURRENT_SEASON_TTL = 600
+PAST_SEASON_TTL = 86400
+CACHE_MAX_ENTRIES = 4096
+# Concurrent page fetches for multi-season lookups (stays within the session's pool)
+MAX_PARALLEL_FETCHES = 8
+
+# Shared session so every fetch reuses pooled keep-alive connections
+# instead of paying a fresh TCP/TLS handshake per request.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=64)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """
+    GET a URL through the shared session (default timeout applied).
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return _session.get(url, **kwargs)
+
+def close_session():
+    """
+    Close the shared session's pooled connections.
+    """
+    _session.close()
+
+# LRU + TTL cache shared by all fetchers: key -> (expires_at, JSON bytes).
+# Values are kept serialized so every hit decodes a fresh copy the caller is free to mutate.
+_response_cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+def ttl_for_season(season: Optional[Any]) -> int:
+    """
+    Return the cache TTL for data belonging to a given season.
+    """
+    try:
+        if season and int(season) < datetime.now().year:
+            return PAST_SEASON_TTL
+    except (TypeError, ValueError):
+        pass
+    return CURRENT_SEASON_TTL
+
+def _cache_get(key: Tuple) -> Optional[Any]:
+    with _cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del _response_cache[key]
+            return None
+        _response_cache.move_to_end(key)
+        return entry[1]
+
+def _cache_put(key: Tuple, value: Any, ttl: int):
+    with _cache_lock:
+        _response_cache[key] = (time.monotonic() + ttl, value)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+def clear_cache():
+    """
+    Drop every cached response.
+    """
+    with _cache_lock:
+        _response_cache.clear()
+
+def get_json_cached(url: str, params: Optional[Dict[str, Any]] = None, ttl: int = CURRENT_SEASON_TTL) -> Any:
+    """
+    GET a URL and decode its JSON body, serving repeats from the TTL cache.
+    Each call returns its own copy. Raises requests.RequestException on failure (failures are never cached).
+    """
+    key = (url, tuple(sorted(params.items())) if params else ())
+    cached = _cache_get(key)
+    if cached is not None:
+        return orjson.loads(cached)
+    
+    response = http_get(url, params=params)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    _cache_put(key, response.content, ttl)
+    return data
+
+def get_wikipedia_html(title: str) -> str:
+    """
+    Fetch a Wikipedia article's HTML via the REST API.
+    Pages are cached on disk for a week; stale copies are revalidated with If-None-Match.
+    An unwritable cache directory only costs the caching, never the page.
+    """
+    key = hashlib.sha1(title.encode("utf-8")).hexdigest()
+    html_path = WIKI_CACHE_DIR / f"{key}.html"
+    etag_path = WIKI_CACHE_DIR / f"{key}.etag"
+    
+    if html_path.exists() and time.time() - html_path.stat().st_mtime < WIKI_CACHE_MAX_AGE:
+        return html_path.read_text(encoding="utf-8")
+    
+    headers = dict(WIKI_HEADERS)
+    if html_path.exists() and etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text().strip()
+    
+    url = f"{WIKI_REST_URL}/{quote(title.replace(' ', '_'), safe='')}"
+    response = http_get(url, headers=headers)
+    
+    if response.status_code == 304:
+        try:
+            html_path.touch()
+        except OSError:
+            pass
+        return html_path.read_text(encoding="utf-8")
+    
+    response.raise_for_status()
+    html = response.text
+    
+    try:
+        WIKI_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        html_path.write_text(html, encoding="utf-8")
+        if response.headers.get("ETag"):
+            etag_path.write_text(response.headers["ETag"])
+    except OSError:
+        # Read-only or full cache directory: serve the fresh page uncached
+        pass
+    
+    return html
+
+def get_json_disk_cached(url: str, params: Optional[Dict[str, Any]] = None, max_age: int = CURRENT_SEASON_TTL) -> Any:
+    """
+    GET a URL and decode its JSON body through an on-disk cache shared across runs.
+    Copies younger than max_age are served from disk; older ones are revalidated
+    with If-None-Match/If-Modified-Since. Raises requests.RequestException on failure;
+    an unwritable cache directory only costs the caching, never the response.
+    """
+    key = hashlib.sha1(repr((url, sorted(params.items()) if params else ())).encode("utf-8")).hexdigest()
+    body_path = HTTP_CACHE_DIR / f"{key}.json"
+    meta_path = HTTP_CACHE_DIR / f"{key}.meta"
+    
+    cached = None
+    if body_path.exists():
+        try:
+            cached = orjson.loads(body_path.read_bytes())
+        except orjson.JSONDecodeError:
+            cached = None
+        if cached is not None and time.time() - body_path.stat().st_mtime < max_age:
+            return cached
+    
+    headers = {}
+    if cached is not None and meta_path.exists():
+        try:
+            meta = orjson.loads(meta_path.read_bytes())
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        except orjson.JSONDecodeError:
+            pass
+    
+    response = http_get(url, params=params, headers=headers)
+    
+    if response.status_code == 304 and cached is not None:
+        try:
+            body_path.touch()
+        except OSError:
+            pass
+        return cached
+    
+    response.raise_for_status()
+    data = response.json()
+    
+    # Write-then-rename so concurrent fetchers (threads or worker processes) never read a half-written file
+    tmp_path = body_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(response.content)
+        tmp_path.replace(body_path)
+        meta_path.write_bytes(orjson.dumps({
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }))
+    except OSError:
+        # Read-only or full cache directory: serve the fresh data uncached
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+    
+    return data
+
+def ttl_cache(season_arg: Optional[int] = None):
+    """
+    Cache a fetcher's non-empty (JSON-serializable) results in the shared TTL cache.
+    Every call returns its own copy, so callers may mutate what they get back.
+    season_arg: index of the positional argument holding the season, used to pick the TTL.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+            cached = _cache_get(key)
+            if cached is not None:
+                return orjson.loads(cached)
+            
+            result = func(*args, **kwargs)
+            if result:
+                season = args[season_arg] if season_arg is not None and season_arg < len(args) else None
+                _cache_put(key, orjson.dumps(result), ttl_for_season(season))
+            return result
+        return wrapper
+    return decorator
 
 def get_player_stats(espn_id: str, year: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -10,13 +267,10 @@ def get_player_stats(espn_id: str, year: Optional[str] = None) -> Dict[str, Any]
     """
     # Use the common v3 endpoint which returns profile and stats summary
     url = f"{COMMON_API_URL}/sports/football/nfl/athletes/{espn_id}"
-    if year:
-        url += f"?season={year}"
+    params = {"season": year} if year else None
     
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+        data = get_json_cached(url, params=params, ttl=ttl_for_season(year))
         
         athlete = data.get("athlete", {})
         
@@ -41,24 +295,20 @@ def get_player_gamelog(espn_id: str, season: str, season_type: int = 2) -> Dict[
     }
     
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return get_json_disk_cached(url, params=params, max_age=ttl_for_season(season))
     except requests.RequestException as e:
         print(f"Error fetching game log: {e}")
         return {}
 
 def get_team_schedule(team_id: str, season: str) -> Dict[str, Any]:
     """
-    Fetch team schedule.
+    Fetch team schedule (cached per team/season).
     """
     url = f"{ESPN_BASE_URL}/teams/{team_id}/schedule"
     params = {"season": season}
     
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return get_json_cached(url, params=params, ttl=ttl_for_season(season))
     except requests.RequestException as e:
         print(f"Error fetching schedule: {e}")
         return {}
@@ -75,24 +325,25 @@ def get_scoreboard(week: int, season: str, season_type: int = 2) -> Dict[str, An
     }
     
     try:
-        response = requests.get(url, params=params)
+        response = http_get(url, params=params)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
         print(f"Error fetching scoreboard: {e}")
         return {}
 
+def _summary_json(game_id: str) -> Dict[str, Any]:
+    """
+    Fetch the ESPN game summary payload (boxscore, drives, plays) through the shared cache.
+    """
+    return get_json_cached(f"{ESPN_BASE_URL}/summary", params={"event": game_id})
+
 def get_game_summary(game_id: str) -> Dict[str, Any]:
     """
     Fetch game summary/details.
     """
-    url = f"{ESPN_BASE_URL}/summary"
-    params = {"event": game_id}
-    
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return _summary_json(game_id)
     except requests.RequestException as e:
         # print(f"Error fetching game summary: {e}")
         return {}
@@ -102,33 +353,38 @@ def search_web(query: str) -> str:
     Perform a web search using DuckDuckGo.
     """
     try:
-        from ddgs import DDGS
-        with DDGS() as ddgs:
-            # Use 'text' method correctly
-            results = [r for r in ddgs.text(query, max_results=3)]
-            if results:
-                summary = ""
-                for r in results:
-                    summary += f"**[{r['title']}]({r['href']})**\n{r['body']}\n\n"
-                return summary
+        summary = _search_web_summary(query)
+        if summary:
+            return summary
     except ImportError:
         return "Web search library `duckduckgo-search` is not installed."
     except Exception as e:
         return f"Error performing search: {e}"
     return "No results found."
 
+@ttl_cache()
+def _search_web_summary(query: str) -> str:
+    """
+    Markdown summary of the top DuckDuckGo results ('' if none); only real results are cached.
+    """
+    from ddgs import DDGS
+    with DDGS() as ddgs:
+        # Use 'text' method correctly
+        results = [r for r in ddgs.text(query, max_results=3)]
+    summary = ""
+    for r in results:
+        summary += f"**[{r['title']}]({r['href']})**\n{r['body']}\n\n"
+    return summary
+
 def get_team_stats(team_id: str, year: Optional[str] = None) -> Dict[str, Any]:
     """
     Fetch team stats from ESPN.
     """
     url = f"{ESPN_BASE_URL}/teams/{team_id}"
-    if year:
-        url += f"?season={year}"
+    params = {"season": year} if year else None
         
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+        data = get_json_cached(url, params=params, ttl=ttl_for_season(year))
         
         # Team endpoint usually returns a 'team' object with 'record', 'nextEvent', etc.
         # For detailed stats, we might need to look into the 'statistics' link often provided in the response.
@@ -143,12 +399,8 @@ def get_game_playbyplay(game_id: str) -> Dict[str, Any]:
     Fetch play-by-play data for a specific game.
     Returns drives and plays with quarter information.
     """
-    url = f"{ESPN_BASE_URL}/summary?event={game_id}"
-    
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return _summary_json(game_id)
     except requests.RequestException as e:
         print(f"Error fetching play-by-play data: {e}")
         return {}
@@ -160,9 +412,7 @@ def get_team_roster(team_id: str) -> Dict[str, Any]:
     url = f"{ESPN_BASE_URL}/teams/{team_id}/roster"
     
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return get_json_cached(url)
     except requests.RequestException as e:
         print(f"Error fetching team roster: {e}")
         return {}
@@ -174,50 +424,34 @@ def get_team_depthchart(team_id: str) -> Dict[str, Any]:
     url = f"{ESPN_BASE_URL}/teams/{team_id}/depthcharts"
     
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return get_json_cached(url)
     except requests.RequestException as e:
         print(f"Error fetching team depth chart: {e}")
         return {}
 
+@ttl_cache(season_arg=0)
 def get_season_awards_wiki(season: str) -> Dict[str, str]:
     """
     Fetch season awards from Wikipedia.
     Returns a dictionary of Award Name -> Winner Name.
     """
     try:
-        import wikipedia
         from bs4 import BeautifulSoup
-        import re
-        from typing import Dict
-        
-        query = f"{season} NFL season"
-        results = wikipedia.search(query)
-        
-        if not results:
-            return {}
-            
-        title = results[0]
-        # Ensure we got the right season page
-        if season not in title or "NFL season" not in title:
-            # Try to find exact match
-            for r in results:
-                if f"{season} NFL season" in r:
-                    title = r
-                    break
         
-        page = wikipedia.page(title, auto_suggest=False)
-        html = page.html()
-        soup = BeautifulSoup(html, 'html.parser')
+        # Season page titles are deterministic, so no search round trip is needed
+        html = get_wikipedia_html(f"{season} NFL season")
+        # Only headings and tables are needed to locate the awards table
+        soup = BeautifulSoup(html, 'lxml', parse_only=_SEASON_AWARDS_STRAINER)
         
         awards = {}
         
         # Look for "Individual season awards" header
         header = soup.find(id="Individual_season_awards")
         if header:
-            # Traverse siblings to find the table
-            curr = header.parent
+            # Climb to the top-level heading, then traverse its siblings to find the table
+            curr = header
+            while curr.parent is not None and curr.parent is not soup:
+                curr = curr.parent
             while curr:
                 curr = curr.find_next_sibling()
                 if curr and curr.name == 'table':
@@ -230,7 +464,7 @@ def get_season_awards_wiki(season: str) -> Dict[str, str]:
                             award_name = cols[0]
                             winner = cols[1]
                             # Clean up winner name (remove citations like [1])
-                            winner = re.sub(r'\[.*?\]', '', winner)
+                            winner = _CITATION_RE.sub('', winner)
                             awards[award_name] = winner
                     break
         
@@ -240,16 +474,15 @@ def get_season_awards_wiki(season: str) -> Dict[str, str]:
         print(f"Error fetching awards from Wikipedia: {e}")
         return {}
 
+@ttl_cache()
 def get_player_awards_wiki(player_name: str) -> List[str]:
     """
     Fetch player awards from Wikipedia infobox.
-    Returns a list of award strings.
+    Returns a list of award strings (non-empty lists are cached).
     """
     try:
         import wikipedia
         from bs4 import BeautifulSoup
-        import re
-        from typing import List
         
         # Search for player page
         results = wikipedia.search(player_name)
@@ -257,9 +490,8 @@ def get_player_awards_wiki(player_name: str) -> List[str]:
             return []
             
         title = results[0]
-        page = wikipedia.page(title, auto_suggest=False)
-        html = page.html()
-        soup = BeautifulSoup(html, 'html.parser')
+        html = get_wikipedia_html(title)
+        soup = BeautifulSoup(html, 'lxml', parse_only=_INFOBOX_STRAINER)
         
         awards = []
         
@@ -280,7 +512,7 @@ def get_player_awards_wiki(player_name: str) -> List[str]:
                                 for li in ul.find_all('li'):
                                     text = li.get_text(strip=True)
                                     # Clean up citations [1]
-                                    text = re.sub(r'\[.*?\]', '', text)
+                                    text = _CITATION_RE.sub('', text)
                                     awards.append(text)
                             else:
                                 # Sometimes it's just text separated by breaks?
@@ -294,6 +526,7 @@ def get_player_awards_wiki(player_name: str) -> List[str]:
         print(f"Error fetching player awards from Wikipedia: {e}")
         return []
 
+@ttl_cache(season_arg=0)
 def get_season_awards_nflcom(season: str) -> Dict[str, str]:
     """
     Fetch season awards from NFL.com honors page as fallback.
@@ -301,38 +534,27 @@ def get_season_awards_nflcom(season: str) -> Dict[str, str]:
     """
     try:
         from bs4 import BeautifulSoup
-        import re
         
         url = f"https://www.nfl.com/news/list-of-nfl-honors-award-winners-from-{season}-nfl-season"
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_get(url, headers=headers)
         
         if response.status_code != 200:
             return {}
             
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         text = soup.get_text()
         
         awards = {}
         
-        # Common award patterns on NFL.com
-        award_patterns = [
-            (r'AP\s+Most\s+Valuable\s+Player[^\n]*\n\s*([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)', 'Most Valuable Player'),
-            (r'AP\s+Offensive\s+Player\s+of\s+the\s+Year[^\n]*\n\s*([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)', 'Offensive Player of the Year'),
-            (r'AP\s+Defensive\s+Player\s+of\s+the\s+Year[^\n]*\n\s*([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)', 'Defensive Player of the Year'),
-            (r'AP\s+Offensive\s+Rookie\s+of\s+the\s+Year[^\n]*\n\s*([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)', 'Offensive Rookie of the Year'),
-            (r'AP\s+Defensive\s+Rookie\s+of\s+the\s+Year[^\n]*\n\s*([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)', 'Defensive Rookie of the Year'),
-            (r'AP\s+Comeback\s+Player\s+of\s+the\s+Year[^\n]*\n\s*([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)', 'Comeback Player of the Year'),
-        ]
-        
-        for pattern, award_name in award_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern, award_name in _NFLCOM_AWARD_PATTERNS:
+            match = pattern.search(text)
             if match:
                 winner = match.group(1).strip()
                 # Clean up winner name
-                winner = re.sub(r'\s+', ' ', winner)
+                winner = _WHITESPACE_RE.sub(' ', winner)
                 awards[award_name] = winner
         
         return awards
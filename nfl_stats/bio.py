@@ -2,7 +2,7 @@
 Biographical data utilities for NFL players.
 Uses existing nflverse player data plus Sleeper API for additional info.
 """
-from .data import load_players
+from .data import find_player_by_name
 from .fantasy import find_sleeper_player
 from datetime import datetime
 
@@ -18,14 +18,7 @@ def get_player_bio(player_name):
         Dict with biographical info
     """
     # Get from nflverse
-    players = load_players()
-    player = None
-    
-    name_lower = player_name.lower()
-    for p in players:
-        if name_lower in p['display_name'].lower():
-            player = p
-            break
+    player = find_player_by_name(player_name)
     
     if not player:
         return None
@@ -91,18 +84,19 @@ def format_height(height_str):
     Format height string (e.g., "72" -> "6'0\"")
     
     Args:
-        height_str: Height in inches as string
+        height_str: Height in inches as string or number
     
     Returns:
-        Formatted height string
+        Formatted height string, or the input unchanged if it isn't a plain number of inches
     """
+    # Already-formatted strings (e.g. ESPN's displayHeight) pass straight through
+    if isinstance(height_str, str) and not height_str.isdigit():
+        return height_str
     try:
         inches = int(height_str)
-        feet = inches // 12
-        remaining_inches = inches % 12
-        return f"{feet}'{remaining_inches}\""
-    except:
+    except (TypeError, ValueError):
         return height_str
+    return f"{inches // 12}'{inches % 12}\""
 
 
 def get_injury_status(player_name):
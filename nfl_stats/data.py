@@ -1,14 +1,28 @@
+import codecs
 import csv
-import json
 import os
-import requests
+import orjson
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from .api import http_get
 
 CACHE_DIR = Path.home() / ".nfl_stats_cache"
 PLAYERS_CACHE_FILE = CACHE_DIR / "players.json"
 PLAYERS_URL = "https://github.com/nflverse/nflverse-data/releases/download/players/players.csv"
 
+# Decoded player list, kept in memory across calls until refresh_players()
+_PLAYERS_CACHE: Optional[List[Dict]] = None
+
+# Name lookup indexes, rebuilt whenever the player list is loaded
+_NAME_INDEX: Dict[str, Dict] = {}
+_LAST_NAME_INDEX: Dict[str, List[Dict]] = defaultdict(list)
+
+# Team and ESPN id lookups, rebuilt alongside the name indexes
+_TEAM_INDEX: Dict[str, List[Dict]] = defaultdict(list)
+_ID_INDEX: Dict[str, Dict] = {}
+
 def ensure_cache_dir():
     """Ensure the cache directory exists."""
     if not CACHE_DIR.exists():
@@ -18,87 +32,173 @@ def download_players_data() -> List[Dict]:
     """Download players data from nflverse and cache it."""
     print("Downloading player database... (this may take a moment)")
     try:
-        response = requests.get(PLAYERS_URL)
-        response.raise_for_status()
-        
-        decoded_content = response.content.decode('utf-8')
-        csv_reader = csv.DictReader(decoded_content.splitlines())
-        
         players = []
-        for row in csv_reader:
-            # Filter for relevant columns to keep cache size down
-            # We need espn_id for the API, and name/team for search
-            if row.get('espn_id'):
-                players.append({
-                    'display_name': row.get('display_name'),
-                    'espn_id': row.get('espn_id'),
-                    'team_abbr': row.get('latest_team'),
-                    'position': row.get('position'),
-                    'status': row.get('status'), 
-                    'rookie_season': row.get('rookie_season'),
-                    'years_exp': row.get('years_of_experience'),
-                    'college': row.get('college_name'),
-                    'jersey': row.get('jersey_number'),
-                    'height': row.get('height'),
-                    'weight': row.get('weight'),
-                    'headshot_url': row.get('headshot')
-                })
+        # Stream the CSV line by line instead of decoding the whole body up front
+        with http_get(PLAYERS_URL, headers={'Accept-Encoding': 'gzip'}, stream=True) as response:
+            response.raise_for_status()
+            csv_reader = csv.DictReader(codecs.iterdecode(response.iter_lines(), 'utf-8'))
+            
+            for row in csv_reader:
+                # Filter for relevant columns to keep cache size down
+                # We need espn_id for the API, and name/team for search
+                if row.get('espn_id'):
+                    players.append({
+                        'display_name': row.get('display_name'),
+                        'espn_id': row.get('espn_id'),
+                        'team_abbr': row.get('latest_team'),
+                        'position': row.get('position'),
+                        'status': row.get('status'), 
+                        'rookie_season': row.get('rookie_season'),
+                        'years_exp': row.get('years_of_experience'),
+                        'college': row.get('college_name'),
+                        'jersey': row.get('jersey_number'),
+                        'height': row.get('height'),
+                        'weight': row.get('weight'),
+                        'headshot_url': row.get('headshot')
+                    })
         
         ensure_cache_dir()
-        with open(PLAYERS_CACHE_FILE, 'w') as f:
-            json.dump(players, f)
+        with open(PLAYERS_CACHE_FILE, 'wb') as f:
+            f.write(orjson.dumps(players))
             
         return players
     except Exception as e:
         print(f"Error downloading player data: {e}")
         return []
 
-def load_players() -> List[Dict]:
-    """Load players from cache or download if missing."""
+def _read_players() -> List[Dict]:
+    """Read players from cache or download if missing."""
     if PLAYERS_CACHE_FILE.exists():
         try:
-            with open(PLAYERS_CACHE_FILE, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
+            with open(PLAYERS_CACHE_FILE, 'rb') as f:
+                return orjson.loads(f.read())
+        except orjson.JSONDecodeError:
             print("Cache corrupted, re-downloading...")
             return download_players_data()
     else:
         return download_players_data()
 
-def get_teams() -> List[Dict]:
-    """Return a static list of NFL teams."""
-    # Basic list, could be expanded or fetched
-    return [
-        {"name": "Arizona Cardinals", "abbr": "ARI", "id": "22"},
-        {"name": "Atlanta Falcons", "abbr": "ATL", "id": "1"},
-        {"name": "Baltimore Ravens", "abbr": "BAL", "id": "33"},
-        {"name": "Buffalo Bills", "abbr": "BUF", "id": "2"},
-        {"name": "Carolina Panthers", "abbr": "CAR", "id": "29"},
-        {"name": "Chicago Bears", "abbr": "CHI", "id": "3"},
-        {"name": "Cincinnati Bengals", "abbr": "CIN", "id": "4"},
-        {"name": "Cleveland Browns", "abbr": "CLE", "id": "5"},
-        {"name": "Dallas Cowboys", "abbr": "DAL", "id": "6"},
-        {"name": "Denver Broncos", "abbr": "DEN", "id": "7"},
-        {"name": "Detroit Lions", "abbr": "DET", "id": "8"},
-        {"name": "Green Bay Packers", "abbr": "GB", "id": "9"},
-        {"name": "Houston Texans", "abbr": "HOU", "id": "34"},
-        {"name": "Indianapolis Colts", "abbr": "IND", "id": "11"},
-        {"name": "Jacksonville Jaguars", "abbr": "JAX", "id": "30"},
-        {"name": "Kansas City Chiefs", "abbr": "KC", "id": "12"},
-        {"name": "Las Vegas Raiders", "abbr": "LV", "id": "13"},
-        {"name": "Los Angeles Chargers", "abbr": "LAC", "id": "24"},
-        {"name": "Los Angeles Rams", "abbr": "LAR", "id": "14"},
-        {"name": "Miami Dolphins", "abbr": "MIA", "id": "15"},
-        {"name": "Minnesota Vikings", "abbr": "MIN", "id": "16"},
-        {"name": "New England Patriots", "abbr": "NE", "id": "17"},
-        {"name": "New Orleans Saints", "abbr": "NO", "id": "18"},
-        {"name": "New York Giants", "abbr": "NYG", "id": "19"},
-        {"name": "New York Jets", "abbr": "NYJ", "id": "20"},
-        {"name": "Philadelphia Eagles", "abbr": "PHI", "id": "21"},
-        {"name": "Pittsburgh Steelers", "abbr": "PIT", "id": "23"},
-        {"name": "San Francisco 49ers", "abbr": "SF", "id": "25"},
-        {"name": "Seattle Seahawks", "abbr": "SEA", "id": "26"},
-        {"name": "Tampa Bay Buccaneers", "abbr": "TB", "id": "27"},
-        {"name": "Tennessee Titans", "abbr": "TEN", "id": "10"},
-        {"name": "Washington Commanders", "abbr": "WAS", "id": "28"},
-    ]
+def _build_indexes(players: List[Dict]):
+    """Index players by full lowercase name, last name, team and ESPN id (first occurrence wins)."""
+    _NAME_INDEX.clear()
+    _LAST_NAME_INDEX.clear()
+    _TEAM_INDEX.clear()
+    _ID_INDEX.clear()
+    for p in players:
+        if p.get('team_abbr'):
+            _TEAM_INDEX[p['team_abbr']].append(p)
+        if p.get('espn_id'):
+            _ID_INDEX.setdefault(p['espn_id'], p)
+        name = (p.get('display_name') or '').lower()
+        if not name:
+            continue
+        _NAME_INDEX.setdefault(name, p)
+        _LAST_NAME_INDEX[name.split()[-1]].append(p)
+
+def load_players() -> List[Dict]:
+    """Load players (memoized) from cache or download if missing, and index them."""
+    global _PLAYERS_CACHE
+    if not _PLAYERS_CACHE:
+        players = _read_players()
+        _build_indexes(players)
+        _PLAYERS_CACHE = players
+    return _PLAYERS_CACHE
+
+def load_players_by_team() -> Dict[str, List[Dict]]:
+    """Players grouped by team abbreviation (shared index, do not mutate)."""
+    load_players()
+    return _TEAM_INDEX
+
+def load_players_by_id() -> Dict[str, Dict]:
+    """Players keyed by ESPN id (shared index, do not mutate)."""
+    load_players()
+    return _ID_INDEX
+
+def refresh_players():
+    """Drop the in-memory player list so the next load re-reads the cache file."""
+    global _PLAYERS_CACHE
+    _PLAYERS_CACHE = None
+
+def warm_reference_data():
+    """
+    Load (downloading on a cold start) the player and draft databases concurrently.
+    """
+    from .draft import load_draft_data
+    
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        players = pool.submit(load_players)
+        draft_picks = pool.submit(load_draft_data)
+        players.result()
+        draft_picks.result()
+
+def find_player_by_name(player_name: str) -> Optional[Dict]:
+    """
+    Find the first player whose display name contains `player_name` (case-insensitive).
+    Exact names resolve through the name index; partial names check last-name
+    candidates before falling back to a full scan.
+    """
+    name_lower = player_name.lower().strip()
+    if not name_lower:
+        return None
+    
+    load_players()
+    
+    player = _NAME_INDEX.get(name_lower)
+    if player:
+        return player
+    
+    for p in _LAST_NAME_INDEX.get(name_lower.split()[-1], []):
+        if name_lower in p['display_name'].lower():
+            return p
+    
+    for p in _NAME_INDEX.values():
+        if name_lower in p['display_name'].lower():
+            return p
+    
+    return None
+
+# Static list of NFL teams, built once at import
+_TEAMS = (
+    {"name": "Arizona Cardinals", "abbr": "ARI", "id": "22"},
+    {"name": "Atlanta Falcons", "abbr": "ATL", "id": "1"},
+    {"name": "Baltimore Ravens", "abbr": "BAL", "id": "33"},
+    {"name": "Buffalo Bills", "abbr": "BUF", "id": "2"},
+    {"name": "Carolina Panthers", "abbr": "CAR", "id": "29"},
+    {"name": "Chicago Bears", "abbr": "CHI", "id": "3"},
+    {"name": "Cincinnati Bengals", "abbr": "CIN", "id": "4"},
+    {"name": "Cleveland Browns", "abbr": "CLE", "id": "5"},
+    {"name": "Dallas Cowboys", "abbr": "DAL", "id": "6"},
+    {"name": "Denver Broncos", "abbr": "DEN", "id": "7"},
+    {"name": "Detroit Lions", "abbr": "DET", "id": "8"},
+    {"name": "Green Bay Packers", "abbr": "GB", "id": "9"},
+    {"name": "Houston Texans", "abbr": "HOU", "id": "34"},
+    {"name": "Indianapolis Colts", "abbr": "IND", "id": "11"},
+    {"name": "Jacksonville Jaguars", "abbr": "JAX", "id": "30"},
+    {"name": "Kansas City Chiefs", "abbr": "KC", "id": "12"},
+    {"name": "Las Vegas Raiders", "abbr": "LV", "id": "13"},
+    {"name": "Los Angeles Chargers", "abbr": "LAC", "id": "24"},
+    {"name": "Los Angeles Rams", "abbr": "LAR", "id": "14"},
+    {"name": "Miami Dolphins", "abbr": "MIA", "id": "15"},
+    {"name": "Minnesota Vikings", "abbr": "MIN", "id": "16"},
+    {"name": "New England Patriots", "abbr": "NE", "id": "17"},
+    {"name": "New Orleans Saints", "abbr": "NO", "id": "18"},
+    {"name": "New York Giants", "abbr": "NYG", "id": "19"},
+    {"name": "New York Jets", "abbr": "NYJ", "id": "20"},
+    {"name": "Philadelphia Eagles", "abbr": "PHI", "id": "21"},
+    {"name": "Pittsburgh Steelers", "abbr": "PIT", "id": "23"},
+    {"name": "San Francisco 49ers", "abbr": "SF", "id": "25"},
+    {"name": "Seattle Seahawks", "abbr": "SEA", "id": "26"},
+    {"name": "Tampa Bay Buccaneers", "abbr": "TB", "id": "27"},
+    {"name": "Tennessee Titans", "abbr": "TEN", "id": "10"},
+    {"name": "Washington Commanders", "abbr": "WAS", "id": "28"},
+)
+
+# Prebuilt lookups so callers never scan _TEAMS
+TEAMS_BY_ABBR = {t['abbr']: t for t in _TEAMS}
+TEAMS_BY_ID = {t['id']: t for t in _TEAMS}
+TEAMS_BY_NAME = {t['name'].lower(): t for t in _TEAMS}
+TEAM_IDS_BY_ABBR = {t['abbr']: t['id'] for t in _TEAMS}
+
+def get_teams() -> Tuple[Dict, ...]:
+    """Return the static list of NFL teams."""
+    return _TEAMS
@@ -1,46 +1,122 @@
 """
 Draft data integration using nflverse data.
 """
-import requests
-import json
+import codecs
+import csv
+import orjson
 import os
+import re
+import sys
+import unicodedata
 from pathlib import Path
+from .api import http_get
 
 CACHE_DIR = Path.home() / '.nfl_stats_cache'
 DRAFT_CACHE_FILE = CACHE_DIR / 'draft_picks.json'
 
+# The only draft_picks.csv columns the app reads; the rest (career stats, AV, ...) are dropped
+DRAFT_COLUMNS = ('season', 'round', 'pick', 'team', 'pfr_player_name', 'pfr_player_id',
+                 'position', 'category', 'college')
+
+# Decoded draft picks, kept in memory across calls until refresh_draft_data()
+_DRAFT_CACHE = None
+
+# Normalized player name -> first draft pick with that name
+_DRAFT_NAME_INDEX = {}
+
+# Normalized last name -> picks with that last name (in draft order)
+_DRAFT_LAST_NAME_INDEX = {}
+
+_NAME_PUNCTUATION_RE = re.compile(r"[^a-z0-9 ]+")
+_NAME_SUFFIXES = frozenset({'jr', 'sr', 'ii', 'iii', 'iv', 'v'})
+
+# Column value -> picks with that value (in draft order), for search_draft_picks
+_DRAFT_COLUMN_INDEXES = {'season': {}, 'team': {}, 'round': {}, 'position': {}}
+
+
+def _normalize_name(name):
+    """
+    Reduce a player name to a lookup key: ASCII, lowercase, no punctuation or suffixes.
+    "A.J. Brown" -> "aj brown", "Odell Beckham Jr." -> "odell beckham"
+    """
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode().lower()
+    tokens = _NAME_PUNCTUATION_RE.sub('', name).split()
+    return ' '.join(token for token in tokens if token not in _NAME_SUFFIXES)
+
+def _index_draft_picks(draft_picks):
+    """
+    Rebuild the name and column indexes for a freshly loaded list of draft picks.
+    """
+    _DRAFT_NAME_INDEX.clear()
+    _DRAFT_LAST_NAME_INDEX.clear()
+    for index in _DRAFT_COLUMN_INDEXES.values():
+        index.clear()
+    
+    for pick in draft_picks:
+        name = _normalize_name(pick.get('pfr_player_name', ''))
+        if name:
+            _DRAFT_NAME_INDEX.setdefault(name, pick)
+            _DRAFT_LAST_NAME_INDEX.setdefault(name.rsplit(' ', 1)[-1], []).append(pick)
+        for column, index in _DRAFT_COLUMN_INDEXES.items():
+            index.setdefault(pick.get(column), []).append(pick)
+    return draft_picks
+
+def _slim_draft_picks(rows):
+    """
+    Keep only DRAFT_COLUMNS for each pick, interning values so repeated
+    teams/positions/colleges/seasons share one string object.
+    """
+    def intern(value):
+        return sys.intern(value) if isinstance(value, str) else value
+    
+    return [{column: intern(row.get(column, '')) for column in DRAFT_COLUMNS} for row in rows]
+
+
 def load_draft_data():
     """
-    Load NFL draft data from nflverse.
+    Load NFL draft data from nflverse (memoized in memory).
     Returns a list of draft pick dictionaries.
     """
+    global _DRAFT_CACHE
+    if not _DRAFT_CACHE:
+        _DRAFT_CACHE = _read_draft_data()
+    return _DRAFT_CACHE
+
+
+def refresh_draft_data():
+    """
+    Drop the in-memory draft picks so the next load re-reads the cache file.
+    """
+    global _DRAFT_CACHE
+    _DRAFT_CACHE = None
+
+
+def _read_draft_data():
+    """
+    Read draft picks from the on-disk cache, downloading them if missing.
+    """
     # Check cache first
     if DRAFT_CACHE_FILE.exists():
-        with open(DRAFT_CACHE_FILE, 'r') as f:
-            return json.load(f)
+        with open(DRAFT_CACHE_FILE, 'rb') as f:
+            return _index_draft_picks(_slim_draft_picks(orjson.loads(f.read())))
     
     # Download from nflverse
     # URL for draft picks data
     url = "https://github.com/nflverse/nflverse-data/releases/download/draft_picks/draft_picks.csv"
     
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        
-        # Parse CSV
-        import csv
-        from io import StringIO
-        
-        csv_data = StringIO(response.text)
-        reader = csv.DictReader(csv_data)
-        draft_picks = list(reader)
+        # Stream and parse the CSV line by line
+        with http_get(url, headers={'Accept-Encoding': 'gzip'}, stream=True) as response:
+            response.raise_for_status()
+            reader = csv.DictReader(codecs.iterdecode(response.iter_lines(), 'utf-8'))
+            draft_picks = _slim_draft_picks(reader)
         
         # Cache it
         CACHE_DIR.mkdir(exist_ok=True)
-        with open(DRAFT_CACHE_FILE, 'w') as f:
-            json.dump(draft_picks, f)
+        with open(DRAFT_CACHE_FILE, 'wb') as f:
+            f.write(orjson.dumps(draft_picks))
         
-        return draft_picks
+        return _index_draft_picks(draft_picks)
     except Exception as e:
         print(f"Error loading draft data: {e}")
         return []
@@ -56,26 +132,40 @@ def get_player_draft_info(player_name):
     Returns:
         Dict with draft info or None if not found
     """
-    draft_data = load_draft_data()
+    load_draft_data()
+    
+    name = _normalize_name(player_name)
+    if not name:
+        return None
     
-    # Normalize name for comparison
-    name_lower = player_name.lower()
+    # Exact normalized name first, then same-last-name picks whose first name
+    # is a prefix match ("Ken" / "Kenneth"), or the only pick with a lone last name
+    pick = _DRAFT_NAME_INDEX.get(name)
+    if pick is None:
+        first, _, last = name.rpartition(' ')
+        candidates = _DRAFT_LAST_NAME_INDEX.get(last, [])
+        if not first:
+            pick = candidates[0] if len(candidates) == 1 else None
+        else:
+            for candidate in candidates:
+                candidate_first = _normalize_name(candidate['pfr_player_name']).rpartition(' ')[0]
+                if candidate_first and (candidate_first.startswith(first) or first.startswith(candidate_first)):
+                    pick = candidate
+                    break
     
-    for pick in draft_data:
-        pick_name = pick.get('pfr_player_name', '').lower()
-        if name_lower in pick_name or pick_name in name_lower:
-            return {
-                'season': pick.get('season'),
-                'round': pick.get('round'),
-                'pick': pick.get('pick'),
-                'team': pick.get('team'),
-                'college': pick.get('college'),
-                'position': pick.get('position'),
-                'category': pick.get('category'),
-                'pfr_id': pick.get('pfr_player_id')
-            }
+    if pick is None:
+        return None
     
-    return None
+    return {
+        'season': pick.get('season'),
+        'round': pick.get('round'),
+        'pick': pick.get('pick'),
+        'team': pick.get('team'),
+        'college': pick.get('college'),
+        'position': pick.get('position'),
+        'category': pick.get('category'),
+        'pfr_id': pick.get('pfr_player_id')
+    }
 
 
 def search_draft_picks(year=None, team=None, round_num=None, position=None):
@@ -92,19 +182,25 @@ def search_draft_picks(year=None, team=None, round_num=None, position=None):
         List of matching draft picks
     """
     draft_data = load_draft_data()
-    results = []
-    
-    for pick in draft_data:
-        # Apply filters
-        if year and pick.get('season') != str(year):
-            continue
-        if team and pick.get('team') != team:
-            continue
-        if round_num and pick.get('round') != str(round_num):
-            continue
-        if position and pick.get('position') != position:
-            continue
-        
-        results.append(pick)
     
-    return results
+    filters = {}
+    if year:
+        filters['season'] = str(year)
+    if team:
+        filters['team'] = team
+    if round_num:
+        filters['round'] = str(round_num)
+    if position:
+        filters['position'] = position
+    
+    if not filters:
+        return list(draft_data)
+    
+    # Seed from the smallest matching bucket, then check the remaining filters
+    buckets = {column: _DRAFT_COLUMN_INDEXES[column].get(value, []) for column, value in filters.items()}
+    seed_column = min(buckets, key=lambda column: len(buckets[column]))
+    
+    return [
+        pick for pick in buckets[seed_column]
+        if all(pick.get(column) == value for column, value in filters.items() if column != seed_column)
+    ]
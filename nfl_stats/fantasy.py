@@ -3,42 +3,109 @@ Sleeper Fantasy Football API integration.
 Free, no authentication required for read-only access.
 API Docs: https://docs.sleeper.com/
 """
-import requests
-import json
+import os
+import threading
+import time
+import orjson
 from pathlib import Path
+from .api import http_get
 
 CACHE_DIR = Path.home() / '.nfl_stats_cache'
-SLEEPER_PLAYERS_CACHE = CACHE_DIR / 'sleeper_players.json'
+SLEEPER_PLAYERS_CACHE = CACHE_DIR / 'sleeper_players.slim.json'
+SLEEPER_NAME_INDEX_CACHE = CACHE_DIR / 'sleeper_name_index.json'
+SLEEPER_HEADERS_CACHE = CACHE_DIR / 'sleeper_players.headers.json'
+
+# The only Sleeper player fields the app reads; the rest (~30 ids, hashtags, metadata) are dropped
+SLEEPER_FIELDS = ('first_name', 'last_name', 'position', 'team', 'age', 'college', 'height', 'weight',
+                  'years_exp', 'status', 'injury_status', 'injury_body_part', 'injury_notes',
+                  'fantasy_positions')
+
+# Decoded players blob, reused while the cache file's mtime is unchanged
+_SLEEPER_PLAYERS = {'mtime': None, 'data': None}
+_SLEEPER_PLAYERS_LOCK = threading.Lock()
+
+# (players cache mtime, full name -> player_id, name token -> player_ids), see get_sleeper_name_index()
+_SLEEPER_NAME_INDEX = (None, {}, {})
+
+# (name index, names, player_ids) flattened for RapidFuzz, rebuilt when the name index changes
+_SLEEPER_FUZZY_CHOICES = (None, [], [])
 
 def get_sleeper_players():
     """
     Get all NFL players from Sleeper API.
     This should only be called once per day due to large file size.
+    The decoded dict is kept in memory until the cache file changes.
     
     Returns:
         Dict of player_id -> player_data
     """
+    with _SLEEPER_PLAYERS_LOCK:
+        if SLEEPER_PLAYERS_CACHE.exists():
+            mtime = SLEEPER_PLAYERS_CACHE.stat().st_mtime
+            if mtime == _SLEEPER_PLAYERS['mtime'] and time.time() - mtime < 86400:
+                return _SLEEPER_PLAYERS['data']
+        
+        players = _load_sleeper_players()
+        if players and SLEEPER_PLAYERS_CACHE.exists():
+            _SLEEPER_PLAYERS['mtime'] = SLEEPER_PLAYERS_CACHE.stat().st_mtime
+            _SLEEPER_PLAYERS['data'] = players
+        return players
+
+
+def _load_sleeper_players():
+    """
+    Read the players blob from the daily disk cache, refreshing it from the API when stale.
+    """
     # Check cache (refresh daily)
-    if SLEEPER_PLAYERS_CACHE.exists():
-        import time
+    cache_valid = SLEEPER_PLAYERS_CACHE.exists()
+    if cache_valid:
         # Check if cache is less than 24 hours old
         cache_age = time.time() - SLEEPER_PLAYERS_CACHE.stat().st_mtime
         if cache_age < 86400:  # 24 hours
-            with open(SLEEPER_PLAYERS_CACHE, 'r') as f:
-                return json.load(f)
+            players = _read_sleeper_cache()
+            if players is not None:
+                return players
+            cache_valid = False
     
-    # Fetch from API
+    # Fetch from API, revalidating a stale cache instead of re-downloading it
     url = "https://api.sleeper.app/v1/players/nfl"
+    headers = {}
+    if cache_valid and SLEEPER_HEADERS_CACHE.exists():
+        try:
+            with open(SLEEPER_HEADERS_CACHE, 'rb') as f:
+                validators = orjson.loads(f.read())
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+        except orjson.JSONDecodeError:
+            pass
     
     try:
-        response = requests.get(url, timeout=30)
+        response = http_get(url, headers=headers, timeout=30)
+        
+        if response.status_code == 304:
+            players = _read_sleeper_cache()
+            if players is not None:
+                # Unchanged upstream: restart the 24h clock (the name index stays valid too)
+                os.utime(SLEEPER_PLAYERS_CACHE, None)
+                if SLEEPER_NAME_INDEX_CACHE.exists():
+                    os.utime(SLEEPER_NAME_INDEX_CACHE, None)
+                return players
+            response = http_get(url, timeout=30)
+        
         response.raise_for_status()
-        players = response.json()
+        players = _slim_sleeper_players(orjson.loads(response.content))
         
         # Cache it
         CACHE_DIR.mkdir(exist_ok=True)
-        with open(SLEEPER_PLAYERS_CACHE, 'w') as f:
-            json.dump(players, f)
+        with open(SLEEPER_PLAYERS_CACHE, 'wb') as f:
+            f.write(orjson.dumps(players))
+        with open(SLEEPER_HEADERS_CACHE, 'wb') as f:
+            f.write(orjson.dumps({
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }))
         
         return players
     except Exception as e:
@@ -46,6 +113,80 @@ def get_sleeper_players():
         return {}
 
 
+def _slim_sleeper_players(players):
+    """
+    Keep only SLEEPER_FIELDS for each player so the cache file parses quickly.
+    """
+    return {
+        player_id: {field: player[field] for field in SLEEPER_FIELDS if field in player}
+        for player_id, player in players.items()
+    }
+
+
+def _read_sleeper_cache():
+    """
+    Read the cached Sleeper players blob, or None if it is corrupted.
+    """
+    try:
+        with open(SLEEPER_PLAYERS_CACHE, 'rb') as f:
+            return orjson.loads(f.read())
+    except orjson.JSONDecodeError:
+        print("Sleeper cache corrupted, re-downloading...")
+        return None
+
+
+def _sleeper_full_name(player):
+    return f"{player.get('first_name', '')} {player.get('last_name', '')}".strip()
+
+
+def _build_sleeper_name_index(all_players):
+    """
+    Index players by lowercase full name (first occurrence wins) and by each name token.
+    """
+    name_index = {}
+    token_index = {}
+    for player_id, player in all_players.items():
+        full_name = _sleeper_full_name(player).lower()
+        if not full_name:
+            continue
+        name_index.setdefault(full_name, player_id)
+        for token in set(full_name.split()):
+            token_index.setdefault(token, []).append(player_id)
+    return name_index, token_index
+
+
+def get_sleeper_name_index(all_players=None):
+    """
+    Get the (full name -> player_id, token -> player_ids) indexes for the Sleeper players cache.
+    Built once per cache refresh and persisted next to the cache file.
+    """
+    global _SLEEPER_NAME_INDEX
+    if all_players is None:
+        all_players = get_sleeper_players()
+    
+    cache_mtime = SLEEPER_PLAYERS_CACHE.stat().st_mtime if SLEEPER_PLAYERS_CACHE.exists() else None
+    if cache_mtime is not None and _SLEEPER_NAME_INDEX[0] == cache_mtime:
+        return _SLEEPER_NAME_INDEX[1], _SLEEPER_NAME_INDEX[2]
+    
+    # Reuse the persisted index if it was built from the current cache file
+    if cache_mtime is not None and SLEEPER_NAME_INDEX_CACHE.exists() \
+            and SLEEPER_NAME_INDEX_CACHE.stat().st_mtime >= cache_mtime:
+        try:
+            with open(SLEEPER_NAME_INDEX_CACHE, 'rb') as f:
+                saved = orjson.loads(f.read())
+            _SLEEPER_NAME_INDEX = (cache_mtime, saved['names'], saved['tokens'])
+            return saved['names'], saved['tokens']
+        except (orjson.JSONDecodeError, KeyError):
+            pass
+    
+    name_index, token_index = _build_sleeper_name_index(all_players)
+    if cache_mtime is not None:
+        with open(SLEEPER_NAME_INDEX_CACHE, 'wb') as f:
+            f.write(orjson.dumps({'names': name_index, 'tokens': token_index}))
+        _SLEEPER_NAME_INDEX = (cache_mtime, name_index, token_index)
+    return name_index, token_index
+
+
 def get_trending_players(sport='nfl', type='add', lookback_hours=24, limit=25):
     """
     Get trending players (most added/dropped).
@@ -66,28 +207,30 @@ def get_trending_players(sport='nfl', type='add', lookback_hours=24, limit=25):
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = http_get(url, params=params)
         response.raise_for_status()
         trending = response.json()
         
         # Get full player data
         all_players = get_sleeper_players()
         
+        get_player = all_players.get
         results = []
+        append = results.append
         for item in trending:
             player_id = item.get('player_id')
-            count = item.get('count', 0)
+            player = get_player(player_id)
+            if player is None:
+                continue
             
-            if player_id in all_players:
-                player = all_players[player_id]
-                results.append({
-                    'player_id': player_id,
-                    'name': f"{player.get('first_name', '')} {player.get('last_name', '')}".strip(),
-                    'position': player.get('position'),
-                    'team': player.get('team'),
-                    'count': count,
-                    'type': type
-                })
+            append({
+                'player_id': player_id,
+                'name': _sleeper_full_name(player),
+                'position': player.get('position'),
+                'team': player.get('team'),
+                'count': item.get('count', 0),
+                'type': type
+            })
         
         return results
     except Exception as e:
@@ -95,6 +238,21 @@ def get_trending_players(sport='nfl', type='add', lookback_hours=24, limit=25):
         return []
 
 
+def _fuzzy_sleeper_player_id(name_lower, name_index):
+    """
+    Best RapidFuzz match for a name against the name index, or None below the cutoff.
+    """
+    global _SLEEPER_FUZZY_CHOICES
+    from rapidfuzz import process, fuzz
+    
+    if _SLEEPER_FUZZY_CHOICES[0] is not name_index:
+        _SLEEPER_FUZZY_CHOICES = (name_index, list(name_index.keys()), list(name_index.values()))
+    _, names, player_ids = _SLEEPER_FUZZY_CHOICES
+    
+    match = process.extractOne(name_lower, names, scorer=fuzz.WRatio, score_cutoff=80)
+    return player_ids[match[2]] if match else None
+
+
 def find_sleeper_player(player_name):
     """
     Find a player in Sleeper database by name.
@@ -106,29 +264,40 @@ def find_sleeper_player(player_name):
         Player data dict or None
     """
     all_players = get_sleeper_players()
-    name_lower = player_name.lower()
+    name_index, token_index = get_sleeper_name_index(all_players)
+    name_lower = player_name.lower().strip()
     
-    # Search through all players
-    for player_id, player in all_players.items():
-        full_name = f"{player.get('first_name', '')} {player.get('last_name', '')}".strip().lower()
-        
-        if name_lower in full_name or full_name in name_lower:
-            return {
-                'player_id': player_id,
-                'name': f"{player.get('first_name', '')} {player.get('last_name', '')}".strip(),
-                'position': player.get('position'),
-                'team': player.get('team'),
-                'age': player.get('age'),
-                'college': player.get('college'),
-                'height': player.get('height'),
-                'weight': player.get('weight'),
-                'years_exp': player.get('years_exp'),
-                'status': player.get('status'),
-                'injury_status': player.get('injury_status'),
-                'fantasy_positions': player.get('fantasy_positions', [])
-            }
+    # Exact full name first, then players whose names contain every known query token
+    player_id = name_index.get(name_lower)
+    if player_id is None:
+        buckets = [token_index[token] for token in name_lower.split() if token in token_index]
+        if buckets:
+            buckets.sort(key=len)
+            others = [set(bucket) for bucket in buckets[1:]]
+            player_id = next((pid for pid in buckets[0] if all(pid in other for other in others)), None)
     
-    return None
+    # Typo-tolerant fallback ("patrik mahomes")
+    if player_id is None:
+        player_id = _fuzzy_sleeper_player_id(name_lower, name_index)
+    
+    if player_id is None or player_id not in all_players:
+        return None
+    
+    player = all_players[player_id]
+    return {
+        'player_id': player_id,
+        'name': _sleeper_full_name(player),
+        'position': player.get('position'),
+        'team': player.get('team'),
+        'age': player.get('age'),
+        'college': player.get('college'),
+        'height': player.get('height'),
+        'weight': player.get('weight'),
+        'years_exp': player.get('years_exp'),
+        'status': player.get('status'),
+        'injury_status': player.get('injury_status'),
+        'fantasy_positions': player.get('fantasy_positions', [])
+    }
 
 
 def get_player_stats_sleeper(player_id, season='2024', season_type='regular'):
@@ -3,6 +3,24 @@ Fantasy points calculator for NFL players.
 Uses standard PPR (Point Per Reception) scoring.
 """
 
+# Stats calculate_fantasy_points scores: (display key, ESPN key)
+FANTASY_STAT_KEYS = (
+    ('Passing Yards', 'passingYards'),
+    ('Passing Touchdowns', 'passingTouchdowns'),
+    ('Interceptions', 'interceptions'),
+    ('Rushing Yards', 'rushingYards'),
+    ('Rushing Touchdowns', 'rushingTouchdowns'),
+    ('Receptions', 'receptions'),
+    ('Receiving Yards', 'receivingYards'),
+    ('Receiving Touchdowns', 'receivingTouchdowns'),
+    ('Fumbles Lost', 'fumblesLost'),
+    ('2-Point Conversions', 'twoPtConversions'),
+)
+
+# Every stat name calculate_fantasy_points reads (display and ESPN spellings)
+_SCORED_STAT_NAMES = frozenset(name for keys in FANTASY_STAT_KEYS for name in keys)
+
+
 def calculate_fantasy_points(stats, position, scoring='ppr'):
     """
     Calculate fantasy points from player stats.
@@ -111,16 +129,15 @@ def calculate_season_fantasy_points(player_stats, position):
         Dict with fantasy points info
     """
     stats = player_stats.get('statistics', {})
-    
-    # Extract relevant stats
-    stat_dict = {}
-    
-    # Try to get stats from the statistics object
-    if isinstance(stats, dict):
-        for category in stats.get('splits', {}).get('categories', []):
-            for stat in category.get('stats', []):
-                stat_name = stat.get('displayName', stat.get('name', ''))
-                stat_value = stat.get('value', 0)
-                stat_dict[stat_name] = stat_value
+    if not isinstance(stats, dict):
+        return calculate_fantasy_points({}, position)
+    
+    # Keep only the stats that score; ESPN returns dozens per category
+    stat_dict = {
+        name: stat.get('value', 0)
+        for category in stats.get('splits', {}).get('categories', [])
+        for stat in category.get('stats', [])
+        if (name := stat.get('displayName', stat.get('name', ''))) in _SCORED_STAT_NAMES
+    }
     
     return calculate_fantasy_points(stat_dict, position)
@@ -1,8 +1,35 @@
 """
 Helper functions for filtering games based on various criteria.
 """
-from typing import List, Dict, Any
+import functools
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from .logic import parse_stat_value, parse_stats_matrix
+
+# Positions whose "yards"/"touchdowns" mean a specific stat line
+_POSITION_STAT_GROUPS = {
+    'WR': 'receiving', 'TE': 'receiving',
+    'RB': 'rushing', 'FB': 'rushing',
+    'QB': 'passing',
+}
+
+# (threshold stat, position group) -> gamelog header names that can hold it
+_STAT_HEADER_TABLE = {
+    # For "yards", we need to be smart about which yards based on position
+    ('yards', 'receiving'): ('Yds', 'Receiving Yards', 'Rec Yds'),
+    ('yards', 'rushing'): ('Yds', 'Rushing Yards', 'Rush Yds'),
+    ('yards', 'passing'): ('Yds', 'Passing Yards', 'Pass Yds'),
+    ('yards', None): ('Yds', 'Yards'),
+    ('touchdowns', 'receiving'): ('TD', 'Rec TD', 'Receiving TD'),
+    ('touchdowns', 'rushing'): ('TD', 'Rush TD', 'Rushing TD'),
+    ('touchdowns', 'passing'): ('TD', 'Pass TD', 'Passing TD'),
+    ('touchdowns', None): ('TD', 'Touchdowns'),
+    # Other stats don't depend on position
+    ('receptions', None): ('Rec', 'Receptions'),
+    ('sacks', None): ('Sack', 'Sacks'),
+    ('tackles', None): ('Tot', 'Total Tackles', 'Tackles'),
+    ('interceptions', None): ('INT', 'Interceptions'),
+}
 
 def filter_games_by_criteria(games: List[Dict], intent: Dict, schedule_data: Dict = None) -> List[Dict]:
     """
@@ -51,6 +78,31 @@ def filter_games_by_criteria(games: List[Dict], intent: Dict, schedule_data: Dic
     return filtered
 
 
+@functools.lru_cache(maxsize=256)
+def _threshold_header_indexes(headers: Tuple[str, ...], threshold_stat: str, position: Optional[str]) -> Tuple[int, ...]:
+    """
+    Column indexes in headers that can hold threshold_stat for this position.
+    Memoized: a gamelog's headers are the same for every game in it.
+    """
+    group = _POSITION_STAT_GROUPS.get(position) if threshold_stat in ('yards', 'touchdowns') else None
+    candidates = _STAT_HEADER_TABLE.get((threshold_stat, group), (threshold_stat,))
+    return tuple(i for i, header in enumerate(headers) if header in candidates)
+
+
+def _stats_meet_threshold(stats: List, indexes: Tuple[int, ...], threshold_value: float) -> bool:
+    """
+    True if any of the given stat columns reaches threshold_value.
+    """
+    for i in indexes:
+        if i < len(stats):
+            try:
+                if parse_stat_value(stats[i]) >= threshold_value:
+                    return True
+            except ValueError:
+                pass
+    return False
+
+
 def check_game_threshold(game: Dict, headers: List[str], threshold_stat: str, threshold_value: float, position: str = None) -> bool:
     """
     Check if a game meets a threshold requirement.
@@ -65,61 +117,19 @@ def check_game_threshold(game: Dict, headers: List[str], threshold_stat: str, th
     Returns:
         True if game meets threshold
     """
-    stats = game.get('stats', [])
-    
-    # Map threshold stat to header name
-    # For "yards", we need to be smart about which yards based on position
-    if threshold_stat == 'yards':
-        if position in ['WR', 'TE']:
-            # Receiving yards for receivers
-            possible_headers = ['Yds', 'Receiving Yards', 'Rec Yds']
-        elif position in ['RB', 'FB']:
-            # Rushing yards for running backs
-            possible_headers = ['Yds', 'Rushing Yards', 'Rush Yds']
-        elif position in ['QB']:
-            # Passing yards for quarterbacks
-            possible_headers = ['Yds', 'Passing Yards', 'Pass Yds']
-        else:
-            # Generic yards - try all
-            possible_headers = ['Yds', 'Yards']
-    elif threshold_stat == 'touchdowns':
-        if position in ['WR', 'TE']:
-            possible_headers = ['TD', 'Rec TD', 'Receiving TD']
-        elif position in ['RB', 'FB']:
-            possible_headers = ['TD', 'Rush TD', 'Rushing TD']
-        elif position in ['QB']:
-            possible_headers = ['TD', 'Pass TD', 'Passing TD']
-        else:
-            possible_headers = ['TD', 'Touchdowns']
-    else:
-        # Other stats
-        stat_mappings = {
-            'receptions': ['Rec', 'Receptions'],
-            'sacks': ['Sack', 'Sacks'],
-            'tackles': ['Tot', 'Total Tackles', 'Tackles'],
-            'interceptions': ['INT', 'Interceptions']
-        }
-        possible_headers = stat_mappings.get(threshold_stat, [threshold_stat])
-    
-    for i, header in enumerate(headers):
-        if header in possible_headers:
-            if i < len(stats):
-                try:
-                    value = float(str(stats[i]).replace(',', '').replace('--', '0'))
-                    if value >= threshold_value:
-                        return True
-                except (ValueError, TypeError):
-                    pass
-    
-    return False
+    indexes = _threshold_header_indexes(tuple(headers), threshold_stat, position)
+    return _stats_meet_threshold(game.get('stats', []), indexes, threshold_value)
 
 
 def count_games_meeting_threshold(games: List[Dict], headers: List[str], threshold_stat: str, threshold_value: float) -> int:
     """
     Count how many games meet a threshold requirement.
     """
-    count = 0
-    for game in games:
-        if check_game_threshold(game, headers, threshold_stat, threshold_value):
-            count += 1
-    return count
+    # Resolve the candidate columns once, then compare whole columns at a time
+    indexes = _threshold_header_indexes(tuple(headers), threshold_stat, None)
+    if not games or not indexes:
+        return 0
+    
+    values = parse_stats_matrix(games, len(headers))[:, list(indexes)]
+    # NaN (missing/non-numeric) compares False, matching the per-game check
+    return int((values >= threshold_value).any(axis=1).sum())
@@ -1,5 +1,36 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
-from .api import get_player_gamelog, get_team_schedule, get_scoreboard
+import numpy as np
+from rich.console import Console
+from .api import (
+    get_player_gamelog, get_team_schedule, get_scoreboard, get_json_disk_cached, ttl_cache,
+    LEADERS_MAX_AGE, ATHLETE_REF_MAX_AGE,
+)
+from .data import TEAM_IDS_BY_ABBR
+from .utils import console
+
+# Concurrent per-leader ESPN lookups in get_league_leaders
+LEADERS_MAX_WORKERS = 16
+
+_NO_COMMA = str.maketrans('', '', ',')
+
+# ESPN team abbreviations that differ from ours (data.py)
+_ESPN_TEAM_ABBR_ALIASES = {'WSH': 'WAS'}
+
+# Map our stat categories to ESPN's leaders-API stat names
+LEADER_STAT_NAMES = {
+    'passing_yards': 'passingYards',
+    'passing_touchdowns': 'passingTouchdowns',
+    'rushing_yards': 'rushingYards',
+    'rushing_touchdowns': 'rushingTouchdowns',
+    'receiving_yards': 'receivingYards',
+    'receiving_touchdowns': 'receivingTouchdowns',
+    'receptions': 'receptions',
+    'interceptions': 'interceptions',
+    'sacks': 'sacks',
+    'tackles': 'totalTackles',
+    'passes_defended': 'defensivePassesDefended',
+}
 
 def get_headers_for_position(position: str) -> List[str]:
     """
@@ -17,19 +48,38 @@ def get_headers_for_position(position: str) -> List[str]:
     # Default generic
     return ['Stat1', 'Stat2', 'Stat3', 'Stat4', 'Stat5']
 
+@ttl_cache(season_arg=1)
 def process_player_gamelog(espn_id: str, season: str, season_type: int = 2, position: str = "QB") -> Dict[str, Any]:
     """
     Fetch and process player game log.
-    Returns a structured object with headers and game rows.
+    Returns a structured object with headers and game rows (memoized).
     """
     data = get_player_gamelog(espn_id, season, season_type)
     
     if not data or 'seasonTypes' not in data:
         return {}
         
-    target_events = []
-    headers = []
+    # Only the first matching category with events is used
+    first = next(_iter_event_categories(data, season_type), None)
+    if first is None:
+        return {
+            "headers": [],
+            "games": [],
+            "team": None
+        }
     
+    season_type_entry, category = first
+    return {
+        "headers": _resolve_headers(category, position),
+        "games": category['events'],
+        # Team info is per season type, so it's returned once rather than copied onto each event
+        "team": season_type_entry.get('displayTeam')
+    }
+
+def _iter_event_categories(data: Dict[str, Any], season_type: int):
+    """
+    Yield (season type entry, category) for each gamelog category with events in the requested season type.
+    """
     for st in data.get('seasonTypes', []):
         # Filter by season type name since ID is missing
         name = st.get('displayName', '').lower()
@@ -37,36 +87,52 @@ def process_player_gamelog(espn_id: str, season: str, season_type: int = 2, posi
             continue
         if season_type == 3 and 'postseason' not in name and 'playoff' not in name:
             continue
-            
+        
         for category in st.get('categories', []):
             # If category has events, it's likely the one we want
             # The name is often None, so we rely on presence of events
             if category.get('events'):
-                # Try to find headers if they exist (unlikely based on debug)
-                if 'labels' in category:
-                    headers = category['labels']
-                elif 'names' in category:
-                    headers = category['names']
-                else:
-                    headers = get_headers_for_position(position)
-                
-                # Attach team info to events
-                events = category.get('events', [])
-                display_team = st.get('displayTeam')
-                for e in events:
-                    e['team'] = display_team
-                    
-                target_events.extend(events)
-                
-                if target_events:
-                    break
-        if target_events:
-            break
-            
-    return {
-        "headers": headers,
-        "games": target_events
-    }
+                yield st, category
+
+def _resolve_headers(category: Dict[str, Any], position: str) -> List[str]:
+    """
+    Column headers for a gamelog category, falling back to the position's defaults.
+    """
+    # Try to find headers if they exist (unlikely based on debug)
+    if 'labels' in category:
+        return category['labels']
+    if 'names' in category:
+        return category['names']
+    return get_headers_for_position(position)
+
+def parse_stat_value(val: Any) -> float:
+    """
+    Parse one gamelog stat cell ('1,234' -> 1234.0, '--' -> 0.0).
+    Raises ValueError if the cell isn't numeric.
+    """
+    text = val if isinstance(val, str) else str(val)
+    if text == '--':
+        return 0.0
+    return float(text.translate(_NO_COMMA))
+
+def _to_float(val: str) -> float:
+    try:
+        return float(val)
+    except ValueError:
+        return np.nan # Non-numeric stat
+
+def parse_stats_matrix(games: List[Dict], ncols: int) -> np.ndarray:
+    """
+    Parse each game's stat strings into a float matrix (commas stripped, '--' as 0).
+    """
+    rows = [[str(val) for val in game.get('stats', [])[:ncols]] for game in games]
+    cells = np.array([row + ['nan'] * (ncols - len(row)) for row in rows], dtype=str).reshape(len(games), ncols)
+    cleaned = np.char.replace(np.char.replace(cells, ',', ''), '--', '0')
+    try:
+        return cleaned.astype(np.float64)
+    except ValueError:
+        # Some cell isn't numeric (e.g. a 'W 24-17' result); convert cell by cell
+        return np.array([[_to_float(val) for val in row] for row in cleaned.tolist()], dtype=np.float64)
 
 def aggregate_stats(games: List[Dict], headers: List[str]) -> Dict[str, Any]:
     """
@@ -76,6 +142,27 @@ def aggregate_stats(games: List[Dict], headers: List[str]) -> Dict[str, Any]:
     if not games or not headers:
         return {}
     
+    return _summarize_stat_matrix(parse_stats_matrix(games, len(headers)), headers)
+
+def aggregate_game_lists(game_lists: List[List[Dict]], headers: List[str]) -> Dict[str, Any]:
+    """
+    aggregate_stats over several players' games as if they were one list.
+    Each list is parsed on its own, so the rows are never concatenated.
+    """
+    matrices = [parse_stats_matrix(games, len(headers)) for games in game_lists if games]
+    if not matrices or not headers:
+        return {}
+    
+    return _summarize_stat_matrix(np.vstack(matrices), headers)
+
+# Rate columns are averaged rather than summed; longest-play columns take the max
+_RATE_HEADERS = frozenset(('Avg', 'Rate', 'Pct', 'Yds/A', 'Avg/R'))
+_LONGEST_HEADERS = frozenset(('Lng', 'Long'))
+
+def _summarize_stat_matrix(values: np.ndarray, headers: List[str]) -> Dict[str, Any]:
+    """
+    Averages/totals for a (games x headers) stat matrix; missing/non-numeric cells are NaN.
+    """
     # Deduplicate headers
     unique_headers = []
     header_counts = {}
@@ -87,48 +174,32 @@ def aggregate_stats(games: List[Dict], headers: List[str]) -> Dict[str, Any]:
             header_counts[h] = 0
             unique_headers.append(h)
             
-    # Initialize sums and maxes
-    sums = {h: 0.0 for h in unique_headers}
-    maxes = {h: 0.0 for h in unique_headers}
-    counts = {h: 0 for h in unique_headers}
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    game_count = values.shape[0]
+    
+    # Every column reduction happens in NumPy; the loop below only picks one per header
+    column_sums = filled.sum(axis=0)
+    sums = column_sums.tolist()
+    means = (column_sums / game_count).tolist()
+    maxes = np.maximum(filled.max(axis=0), 0.0).tolist()
+    has_values = valid.any(axis=0).tolist()
     
-    for game in games:
-        stats = game.get('stats', [])
-        for i, val in enumerate(stats):
-            if i < len(unique_headers):
-                header = unique_headers[i]
-                try:
-                    # Clean value (remove commas, handle --)
-                    clean_val = str(val).replace(',', '').replace('--', '0')
-                    float_val = float(clean_val)
-                    sums[header] += float_val
-                    
-                    if float_val > maxes[header]:
-                        maxes[header] = float_val
-                        
-                    counts[header] += 1
-                except ValueError:
-                    pass # Non-numeric stat
-                    
-    # Calculate averages
     averages = {}
-    game_count = len(games)
-    if game_count > 0:
-        for h in unique_headers:
-            if counts[h] > 0:
-                averages[h] = sums[h] / game_count
-                
-    # Fix totals for non-summable stats
-    totals = sums.copy()
-    for h in unique_headers:
+    totals = {}
+    for h, total, mean, longest, counted in zip(unique_headers, sums, means, maxes, has_values):
         base_header = h.split('.')[0]
-        if base_header in ['Avg', 'Rate', 'Pct', 'Yds/A', 'Avg/R']:
+        if counted:
+            averages[h] = mean
+        
+        if base_header in _RATE_HEADERS:
             # These shouldn't be summed, use average instead (or recalculate if possible, but avg is better than sum)
-            totals[h] = averages.get(h, 0)
-        elif base_header in ['Lng', 'Long']:
-            # Use max for longest
-            totals[h] = maxes[h]
-            averages[h] = maxes[h] # Avg of max doesn't make sense, just show max
+            totals[h] = mean if counted else 0
+        elif base_header in _LONGEST_HEADERS:
+            # Use max for longest; avg of max doesn't make sense, just show max
+            totals[h] = averages[h] = longest
+        else:
+            totals[h] = total
                 
     return {
         "averages": averages,
@@ -155,158 +226,172 @@ def get_team_game_result(team_id: str, season: str, week: int) -> Dict[str, Any]
             
     return None
 
-def get_league_leaders(stat_category: str, season: str, limit: int = 10, season_type: int = 2) -> List[Dict[str, Any]]:
+def _build_leader(leader: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Get league leaders using ESPN's leaderboard API (INSTANT!).
+    Turn one leaders-API entry into our leader row, resolving name/team via its refs if needed.
     """
-    import requests
+    # Get basic info from leader object
+    value = leader.get('value', 0)
+    
+    # Get athlete name and team
+    display_name = leader.get('displayName')
+    team_name = ''
+    position = ''
+    
+    if not display_name:
+        # Fetch athlete details
+        athlete_ref = leader.get('athlete', {}).get('$ref')
+        if athlete_ref:
+            try:
+                ath_data = get_json_disk_cached(athlete_ref, max_age=ATHLETE_REF_MAX_AGE)
+                display_name = ath_data.get('displayName') or ath_data.get('fullName')
+                position = ath_data.get('position', {}).get('abbreviation', '')
+                
+                # Try to get team from athlete data
+                team_ref = ath_data.get('team', {}).get('$ref')
+                if team_ref:
+                    team_data = get_json_disk_cached(team_ref, max_age=ATHLETE_REF_MAX_AGE)
+                    team_name = team_data.get('abbreviation') or team_data.get('displayName')
+            except:
+                display_name = "Unknown Player"
     
-    # Map our stat categories to ESPN's stat names
-    stat_mapping = {
-        'passing_yards': 'passingYards',
-        'passing_touchdowns': 'passingTouchdowns',
-        'rushing_yards': 'rushingYards',
-        'rushing_touchdowns': 'rushingTouchdowns',
-        'receiving_yards': 'receivingYards',
-        'receiving_touchdowns': 'receivingTouchdowns',
-        'receptions': 'receptions',
-        'interceptions': 'interceptions',
-        'sacks': 'sacks',
-        'tackles': 'totalTackles',
-        'passes_defended': 'defensivePassesDefended',
+    return {
+        'player': display_name or "Unknown",
+        'team': team_name,
+        'position': position,
+        'stat_value': float(value),
+        'games': 17,  # Will be updated below for current season
+        # Stored for the games-played lookup, removed before returning
+        'athlete_ref': leader.get('athlete', {}).get('$ref')
     }
+
+def _fetch_games_played(leader: Dict[str, Any]) -> None:
+    """
+    Update leader['games'] from the athlete's ESPN statistics, keeping the default on failure.
+    """
+    try:
+        # Get athlete ref from the leader data (we already fetched it above)
+        athlete_ref = leader.get('athlete_ref')
+        if athlete_ref:
+            # Fetch athlete statistics (games played changes weekly, the athlete record doesn't)
+            ath_data = get_json_disk_cached(athlete_ref, max_age=ATHLETE_REF_MAX_AGE)
+            stats_ref = ath_data.get('statistics', {}).get('$ref')
+            
+            if stats_ref:
+                stats_data = get_json_disk_cached(stats_ref, max_age=LEADERS_MAX_AGE)
+                splits = stats_data.get('splits', {})
+                categories = splits.get('categories', [])
+                
+                # Find 'general' category and get gamesPlayed
+                for cat in categories:
+                    if cat.get('name') == 'general':
+                        for stat in cat.get('stats', []):
+                            if stat.get('name') == 'gamesPlayed':
+                                games = int(float(stat.get('value', 17)))
+                                leader['games'] = games
+                                break
+                        break
+    except:
+        # If fetching fails for this player, keep default
+        pass
+
+def _team_games_played(team_abbr: str, season: str) -> Optional[int]:
+    """
+    Completed regular-season games for a team (ESPN abbreviation), from its (cached) schedule.
+    """
+    team_id = TEAM_IDS_BY_ABBR.get(_ESPN_TEAM_ABBR_ALIASES.get(team_abbr, team_abbr))
+    if not team_id:
+        return None
     
-    if stat_category not in stat_mapping:
+    events = get_team_schedule(team_id, season).get('events', [])
+    if not events:
+        return None
+    return sum(
+        1 for event in events
+        if (event.get('competitions') or [{}])[0].get('status', {}).get('type', {}).get('completed')
+    )
+
+def get_league_leaders(stat_category: str, season: str, limit: int = 10, season_type: int = 2, precise: bool = False, console: Console = console) -> List[Dict[str, Any]]:
+    """
+    Get league leaders using ESPN's leaderboard API (INSTANT!).
+    For an in-progress regular season, games played comes from each team's schedule
+    (one request per team); precise=True reads every leader's own stats instead.
+    Errors are reported on console (the caller's, e.g. an API request's recording console).
+    """
+    espn_stat_name = LEADER_STAT_NAMES.get(stat_category)
+    if not espn_stat_name:
         return []
     
-    espn_stat_name = stat_mapping[stat_category]
-    
     # Fetch from ESPN's v2 leaders API
     url = f"http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/seasons/{season}/types/{season_type}/leaders"
     
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+        data = get_json_disk_cached(url, max_age=LEADERS_MAX_AGE)
         
-        # Find the category
-        categories = data.get('categories', [])
-        for category in categories:
-            if category.get('name') == espn_stat_name:
-                # Fetch the full category data
-                cat_url = category.get('$ref')
-                leaders_data = []
-                
-                if cat_url:
-                    cat_resp = requests.get(cat_url)
-                    cat_data = cat_resp.json()
-                    leaders_data = cat_data.get('leaders', [])
-                else:
-                    # Check for inline leaders
-                    leaders_data = category.get('leaders', [])
-                
-                leaders_data = leaders_data[:limit]
-                leaders = []
-                
-                for leader in leaders_data:
-                    # Get basic info from leader object
-                    display_value = leader.get('displayValue', '0')
-                    value = leader.get('value', 0)
-                    
-                    # Get athlete name and team
-                    display_name = leader.get('displayName')
-                    team_name = ''
-                    position = ''
-                    
-                    if not display_name:
-                        # Fetch athlete details
-                        athlete_ref = leader.get('athlete', {}).get('$ref')
-                        if athlete_ref:
-                            try:
-                                ath_resp = requests.get(athlete_ref)
-                                ath_data = ath_resp.json()
-                                display_name = ath_data.get('displayName') or ath_data.get('fullName')
-                                position = ath_data.get('position', {}).get('abbreviation', '')
-                                
-                                # Try to get team from athlete data
-                                team_ref = ath_data.get('team', {}).get('$ref')
-                                if team_ref:
-                                    team_resp = requests.get(team_ref)
-                                    team_data = team_resp.json()
-                                    team_name = team_data.get('abbreviation') or team_data.get('displayName')
-                            except:
-                                display_name = "Unknown Player"
-                    
-                    # Store athlete_ref for later games lookup
-                    athlete_ref_for_games = leader.get('athlete', {}).get('$ref')
-                    
-                    leaders.append({
-                        'player': display_name or "Unknown",
-                        'team': team_name,
-                        'position': position,
-                        'stat_value': float(value),
-                        'games': 17,  # Will be updated below for current season
-                        'athlete_ref': athlete_ref_for_games
-                    })
-                
-                # For the current/in-progress season, try to fetch actual games from ESPN
-                import datetime
-                current_year = datetime.datetime.now().year
-                current_month = datetime.datetime.now().month
-                
-                if int(season) >= current_year:
-                    # Try to fetch actual games played from ESPN athlete statistics
+        # Find the category with one dict probe
+        category = {c.get('name'): c for c in data.get('categories', [])}.get(espn_stat_name)
+        if not category:
+            return []
+        
+        # Fetch the full category data
+        cat_url = category.get('$ref')
+        leaders_data = []
+        
+        if cat_url:
+            cat_data = get_json_disk_cached(cat_url, max_age=LEADERS_MAX_AGE)
+            leaders_data = cat_data.get('leaders', [])
+        else:
+            # Check for inline leaders
+            leaders_data = category.get('leaders', [])
+        
+        leaders_data = leaders_data[:limit]
+        if not leaders_data:
+            return []
+        
+        # Athlete/team refs are independent round trips; resolve all leaders concurrently
+        with ThreadPoolExecutor(max_workers=min(len(leaders_data), LEADERS_MAX_WORKERS)) as pool:
+            leaders = list(pool.map(_build_leader, leaders_data))
+        
+        # For the current/in-progress season, try to fetch actual games from ESPN
+        import datetime
+        current_year = datetime.datetime.now().year
+        current_month = datetime.datetime.now().month
+        
+        if int(season) >= current_year:
+            with ThreadPoolExecutor(max_workers=min(len(leaders), LEADERS_MAX_WORKERS)) as pool:
+                per_athlete = leaders
+                if not precise and season_type == 2:
+                    # Leaders share a handful of teams: one schedule per team instead of two refs per leader
+                    teams = list({leader['team'] for leader in leaders if leader['team']})
+                    team_games = dict(zip(teams, pool.map(lambda team: _team_games_played(team, season), teams)))
+                    per_athlete = []
                     for leader in leaders:
-                        try:
-                            # Get athlete ref from the leader data (we already fetched it above)
-                            athlete_ref = leader.get('athlete_ref')
-                            if athlete_ref:
-                                # Fetch athlete statistics
-                                ath_resp = requests.get(athlete_ref)
-                                if ath_resp.status_code == 200:
-                                    ath_data = ath_resp.json()
-                                    stats_ref = ath_data.get('statistics', {}).get('$ref')
-                                    
-                                    if stats_ref:
-                                        stats_resp = requests.get(stats_ref)
-                                        if stats_resp.status_code == 200:
-                                            stats_data = stats_resp.json()
-                                            splits = stats_data.get('splits', {})
-                                            categories = splits.get('categories', [])
-                                            
-                                            # Find 'general' category and get gamesPlayed
-                                            for cat in categories:
-                                                if cat.get('name') == 'general':
-                                                    for stat in cat.get('stats', []):
-                                                        if stat.get('name') == 'gamesPlayed':
-                                                            games = int(float(stat.get('value', 17)))
-                                                            leader['games'] = games
-                                                            break
-                                                    break
-                        except:
-                            # If fetching fails for this player, keep default
-                            pass
-                    
-                    # Fallback: For any leaders still at 17 (ESPN data unavailable), estimate based on week
-                    if current_month >= 9:  # September or later in current year
-                        week_of_year = datetime.datetime.now().isocalendar()[1]
-                        estimated_week = min(week_of_year - 35, 18)
-                        estimated_games = max(estimated_week - 1, 1)
-                        
-                        for leader in leaders:
-                            if leader['games'] == 17:  # ESPN data wasn't available
-                                leader['games'] = estimated_games
+                        games = team_games.get(leader['team'])
+                        if games:
+                            leader['games'] = games
+                        else:
+                            per_athlete.append(leader)
                 
-                # Clean up athlete_ref from leader data (it was temporary)
-                for leader in leaders:
-                    if 'athlete_ref' in leader:
-                        del leader['athlete_ref']
+                # Try to fetch actual games played from ESPN athlete statistics
+                list(pool.map(_fetch_games_played, per_athlete))
+            
+            # Fallback: For any leaders still at 17 (ESPN data unavailable), estimate based on week
+            if current_month >= 9:  # September or later in current year
+                week_of_year = datetime.datetime.now().isocalendar()[1]
+                estimated_week = min(week_of_year - 35, 18)
+                estimated_games = max(estimated_week - 1, 1)
                 
-                return leaders
+                for leader in leaders:
+                    if leader['games'] == 17:  # ESPN data wasn't available
+                        leader['games'] = estimated_games
         
-        return []
+        # Clean up athlete_ref from leader data (it was temporary)
+        for leader in leaders:
+            if 'athlete_ref' in leader:
+                del leader['athlete_ref']
+        
+        return leaders
     except Exception as e:
-        from .utils import console
         console.print(f"[red]Error fetching leaders: {e}[/red]")
         return []
 
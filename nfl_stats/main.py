@@ -1,25 +1,197 @@
 import argparse
+import functools
+import os
+import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from .data import load_players, get_teams
-from .search import identify_entity
-from .api import get_player_stats, get_team_stats, get_game_summary, search_web, get_team_schedule
+from itertools import islice
+import numpy as np
+from rapidfuzz import process, fuzz
+from .data import load_players_by_team, load_players_by_id, TEAMS_BY_ABBR, TEAMS_BY_ID, TEAM_IDS_BY_ABBR
+from .search import identify_entity, search_player
+from .api import (
+    get_player_stats, get_team_stats, get_game_summary, search_web, get_team_schedule,
+    get_team_depthchart, get_season_awards_wiki, get_season_awards_nflcom, get_player_awards_wiki,
+    MAX_PARALLEL_FETCHES
+)
 from .parser import parse_query
-from .logic import process_player_gamelog, aggregate_stats, get_team_game_result, get_league_leaders
-from .utils import print_player_profile, print_team_stats, console
+from .logic import process_player_gamelog, aggregate_stats, aggregate_game_lists, get_team_game_result, get_league_leaders, get_headers_for_position
+from .bio import get_player_bio, get_injury_status, format_height
+from .draft import search_draft_picks, get_player_draft_info
+from .fantasy import get_trending_players
+from .fantasy_points import calculate_season_fantasy_points
+from .filters import check_game_threshold
+from .playbyplay import get_longest_play, get_player_active_seasons, get_season_quarter_stats
+from .visualizer import animate_play_progression, generate_play_diagram
+from .utils import print_player_profile, print_team_stats, console, DeferredStatus
+from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.markdown import Markdown
-
-from rich.prompt import Prompt
 from contextlib import nullcontext
 
-def process_query(full_query: str, use_spinner: bool = True):
+# "news", "injury", "contract", "trade"... anywhere in the query imply a general web search
+_GENERAL_SEARCH_RE = re.compile(r"news|injur(?:y|ies)|contract|trade|rumor|report|salary", re.IGNORECASE)
+
+# Display order for position groups in the full roster view
+_POSITION_ORDER = ('QB', 'RB', 'WR', 'TE', 'OL', 'C', 'G', 'T', 'DL', 'DE', 'DT', 'LB', 'CB', 'S', 'DB', 'K', 'P', 'LS')
+_POSITION_RANK = {pos: i for i, pos in enumerate(_POSITION_ORDER)}
+
+# Handle position aliases (ESPN depth chart uses specific positions)
+# e.g., "S" (Safety) should match both "SS" (Strong Safety) and "FS" (Free Safety)
+_POSITION_ALIASES = {
+    'S': frozenset(('SS', 'FS', 'S')),  # Safety includes Strong and Free Safety
+    'DB': frozenset(('CB', 'SS', 'FS', 'S', 'DB')),  # Defensive Back includes all secondary
+    'LB': frozenset(('WLB', 'SLB', 'LILB', 'RILB', 'MLB', 'OLB', 'ILB', 'LB')),  # Linebacker includes all LB variants
+    'DL': frozenset(('DE', 'DT', 'NT', 'DL')),  # Defensive Line
+    'OL': frozenset(('C', 'G', 'T', 'OL')),  # Offensive Line
+    'K': frozenset(('PK', 'K')),  # Kicker (ESPN uses PK for Place Kicker)
+}
+
+# Full award names for common abbreviations (e.g. MVP -> Most Valuable Player)
+_AWARD_NAMES = {
+    'MVP': 'Most Valuable Player',
+    'OPOY': 'Offensive Player of the Year',
+    'DPOY': 'Defensive Player of the Year',
+    'OROY': 'Offensive Rookie of the Year',
+    'DROY': 'Defensive Rookie of the Year',
+    'CPOY': 'Comeback Player of the Year'
+}
+
+# Common patterns for award winners in news snippets, filled in per season/award, most common first
+# e.g. "Josh Allen won the 2024 NFL MVP"
+# e.g. "Lamar Jackson named 2023 MVP"
+# The captured name must be capitalized (inner capitals, apostrophes and hyphens allowed: McCaffrey, Ja'Marr);
+# only the surrounding phrase is matched case-insensitively
+_AWARD_WINNER_TEMPLATES = (
+    r"([A-Z][A-Za-z'’-]+ [A-Z][A-Za-z'’-]+) (?i:(?:won|wins|named|voted|awarded|takes home) (?:the )?(?:{season} )?(?:NFL )?{award})",
+    r"(?i:(?:{season} )?(?:NFL )?{award} (?:winner|recipient) (?:is|was)) ([A-Z][A-Za-z'’-]+ [A-Z][A-Za-z'’-]+)",
+    r"([A-Z][A-Za-z'’-]+ [A-Z][A-Za-z'’-]+) (?i:(?:beats|edges|tops|defeats) .*? (?:for|in) (?:the )?.*?{award})",
+    r"([A-Z][A-Za-z'’-]+ [A-Z][A-Za-z'’-]+) (?i:(?:is|named) (?:the )?{season} (?:NFL )?{award})",
+    r"([A-Z][A-Za-z'’-]+ [A-Z][A-Za-z'’-]+) (?i:wins (?:the )?{award})",
+)
+
+# Clean-ups for a matched winner name: team/position prefixes and trailing punctuation
+_WINNER_PREFIX_RE = re.compile(r'^(Bills|Chiefs|Ravens|Eagles|QB|WR|RB|The)\s+', re.IGNORECASE)
+_TRAILING_PUNCT_RE = re.compile(r'[.,;:]$')
+
+@functools.lru_cache(maxsize=256)
+def _award_winner_patterns(season: str, award: str) -> tuple:
+    """Compiled award-winner patterns for one season/award pair (season is None when the query has no year)."""
+    return tuple(
+        re.compile(t.format(season=re.escape(str(season)), award=re.escape(award)))
+        for t in _AWARD_WINNER_TEMPLATES
+    )
+
+# Titles/URLs announcing an MVP win, e.g. "wins 2018 NFL MVP" (captures the year)
+_TITLE_URL_MVP_RE = re.compile(r'(?:wins?|won|earned?).*?(\d{4}).*?(?:MVP|most.*?valuable)', re.IGNORECASE)
+
+# Very specific patterns that indicate actually winning MVP (each captures the year)
+# DOTALL so a line break inside a sentence is spanned like any other character
+_MVP_WIN_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r'won.*?MVP.*?(?:in|for).*?(\d{4})',  # "won MVP in 2019"
+    r'(\d{4}).*?MVP.*?(?:winner|award|season)',  # "2019 MVP winner"
+    r'MVP.*?(\d{4}).*?(?:winner|season)',  # "MVP 2019 winner"
+    r'earned.*?MVP.*?(\d{4})',  # "earned MVP in 2019"
+    r'named.*?MVP.*?(\d{4})',  # "named MVP in 2019"
+))
+
+# Prediction/candidate language that disqualifies a sentence; one alternation scans each sentence once
+_MVP_EXCLUDE_RE = re.compile(
+    r'(?:favorite|could|predict|candidate|odds|to\swin|makes.*?case).*?MVP',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Sentences of a search-results blob (runs between periods, line breaks included)
+_SENTENCE_RE = re.compile(r'[^.]+')
+
+# Any 4-digit run; the MVP year patterns all capture one
+_YEAR_TOKEN_RE = re.compile(r'\d{4}')
+
+# Draft/college mentions that disqualify an MVP sentence
+_COLLEGE_NOISE_RE = re.compile(r'draft|heisman|lsu|national championship', re.IGNORECASE)
+
+# Draft/college mentions near a title/URL year that rule it out as an MVP season
+_DRAFT_CONTEXT_RE = re.compile(r'draft|heisman', re.IGNORECASE)
+
+# Words that mark award search results as being about NFL football at all
+_RELEVANCE_RE = re.compile(r'nfl|football|quarterback|mvp', re.IGNORECASE)
+
+# Award names that mark an award as NFL (vs college) when the user asks for "nfl awards"
+_NFL_KW_RE = re.compile(r'nfl|pro bowl|all-pro|super bowl', re.IGNORECASE)
+
+# Fallback fantasy scoring by ESPN stat display name: first rule whose keyword appears in the name wins
+# (keywords, points per unit, breakdown label suffix)
+_FANTASY_FALLBACK_RULES = (
+    (('Rushing Yards',), 0.1, ''),
+    (('Rushing Touchdowns',), 6, ''),
+    (('Receiving Yards',), 0.1, ''),
+    (('Receiving Touchdowns', 'Rec TD'), 6, ''),
+    (('Receptions',), 1, ' (PPR)'),
+    (('Passing Yards',), 0.04, ''),
+    (('Passing Touchdowns',), 4, ''),
+)
+
+@functools.lru_cache(maxsize=None)
+def _fantasy_fallback_rule(stat_name: str):
+    """(points per unit, label suffix) for a stat display name, or None if it isn't scored."""
+    for keywords, multiplier, label_suffix in _FANTASY_FALLBACK_RULES:
+        if any(kw in stat_name for kw in keywords):
+            return multiplier, label_suffix
+    return None
+
+# Rank column labels for the top of the league leaders table
+_RANK_MEDALS = {1: "🥇", 2: "🥈", 3: "🥉"}
+
+# Comparison winner markers indexed by sign + 1: player 2, tie, player 1
+_WINNER_MARKERS = ("🔵", "🟡", "🟢")
+
+# Stats where the smaller value wins a comparison (higher is better for everything else)
+_LOWER_IS_BETTER = frozenset({'INT'})
+
+def _comparison_winner(val1, val2, lower_is_better: bool = False) -> str:
+    """Marker for whichever player has the better value."""
+    sign = (val1 > val2) - (val1 < val2)
+    return _WINNER_MARKERS[(-sign if lower_is_better else sign) + 1]
+
+def _default_season() -> str:
+    """The season in progress: before March we are still in last year's season."""
+    now = datetime.now()
+    return str(now.year - 1 if now.month < 3 else now.year)
+
+def _roster_position_key(item):
+    """Sort key for (position, players) pairs: known groups by rank, others alphabetically after."""
+    return _POSITION_RANK.get(item[0], len(_POSITION_ORDER)), item[0]
+
+# Longest possible play from scrimmage (own 1-yard line to the end zone)
+_MAX_PLAY_YARDS = 99
+
+# Kickoff hours (UTC) that count as prime time: roughly 7 PM ET through late West Coast games
+_PRIME_HOURS = frozenset((0, 1, 2, 3, 4, 23))
+
+# Lowercase English month names indexed by month - 1, matching the parser's month filters
+_MONTH_NAMES = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december"
+)
+
+# Month name -> the "MM" field of an ISO date (date_str[5:7]), so month filters can skip parsing
+_MONTH_CODES = {name: f"{month:02d}" for month, name in enumerate(_MONTH_NAMES, 1)}
+
+def _parse_espn_date(date_str: str) -> datetime:
+    """Parse an ESPN event date, ISO-8601 UTC like "2024-09-08T17:00Z"."""
+    return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+
+def process_query(full_query: str, use_spinner: bool = True, console: Console = console):
     """
     Process a natural language query and display results.
+    Output goes to `console` (the shared CLI console by default); the API
+    server passes a per-request recording console.
     """
+    # Spinner only shows if the query is still running after SPINNER_DELAY (cache hits never see it)
     if use_spinner:
-        status_ctx = console.status(f"[bold green]Processing '{full_query}'...[/bold green]")
+        status_ctx = DeferredStatus(console, f"[bold green]Processing '{full_query}'...[/bold green]")
     else:
         status_ctx = nullcontext()
 
@@ -30,19 +202,15 @@ def process_query(full_query: str, use_spinner: bool = True):
         
         # Set season early for all query types
         # If intent has a season, use it. Otherwise default to logic.
-        if intent["season"]:
-            season = intent["season"]
-        else:
-            season = str(datetime.now().year)
-            if datetime.now().month < 3:
-                season = str(int(season) - 1)
+        season = intent["season"] or _default_season()
         
         # Check for "news", "injury", "contract", "trade" keywords which imply a general search
-        general_keywords = ["news", "injury", "injuries", "contract", "trade", "rumor", "report", "salary"]
-        if any(k in full_query.lower() for k in general_keywords):
+        if _GENERAL_SEARCH_RE.search(full_query):
             console.print(f"[bold]Searching web for: {full_query}[/bold]")
             results = search_web(full_query)
             if results:
+                # Deferred: rich.markdown pulls in markdown-it, which only this branch needs
+                from rich.markdown import Markdown
                 console.print(Panel(Markdown(results), title="Web Search Results"))
             else:
                 console.print("[yellow]No results found.[/yellow]")
@@ -57,7 +225,7 @@ def process_query(full_query: str, use_spinner: bool = True):
             stat_display = stat_category.replace('_', ' ').title()
             console.print(f"[bold cyan]Fetching Top {limit} - {stat_display} ({season})...[/bold cyan]")
             
-            leaders = get_league_leaders(stat_category, season, limit=limit, season_type=intent["season_type"])
+            leaders = get_league_leaders(stat_category, season, limit=limit, season_type=intent["season_type"], console=console)
             
             if leaders:
                 table = Table(title=f"🏆 {stat_display} Leaders - {season}")
@@ -68,17 +236,14 @@ def process_query(full_query: str, use_spinner: bool = True):
                 table.add_column(stat_display, style="green", justify="right")
                 table.add_column("Games", justify="right", width=6)
                 
-                for i, leader in enumerate(leaders, 1):
-                    # Add medal emojis for top 3
-                    rank_display = {1: "🥇", 2: "🥈", 3: "🥉"}.get(i, str(i))
-                    table.add_row(
-                        rank_display,
-                        leader['player'],
-                        leader['team'],
-                        leader['position'],
-                        f"{leader['stat_value']:.0f}",
-                        str(leader['games'])
-                    )
+                # Medal emojis for the top 3
+                rows = (
+                    (_RANK_MEDALS.get(i) or str(i), leader['player'], leader['team'], leader['position'],
+                     f"{leader['stat_value']:.0f}", str(leader['games']))
+                    for i, leader in enumerate(leaders, 1)
+                )
+                for row in rows:
+                    table.add_row(*row)
                 
                 console.print(table)
                 
@@ -147,7 +312,6 @@ def process_query(full_query: str, use_spinner: bool = True):
             # If players have different positions, try to find better matches
             if len(players) == 2 and players[0].get('position') != players[1].get('position'):
                 # Try to find a player with matching position for the second player
-                from .search import search_player
                 alt_matches = search_player(player_names[1], limit=10)
                 target_position = players[0].get('position')
                 
@@ -161,30 +325,35 @@ def process_query(full_query: str, use_spinner: bool = True):
                 console.print("[red]Need exactly 2 players to compare.[/red]")
                 return
             
-            # Fetch stats for both players
-            comparison_data = []
-            for player in players:
-                position = player.get('position', 'QB')
-                gamelog = process_player_gamelog(player['espn_id'], season, season_type=intent["season_type"], position=position)
-                
-                if gamelog.get('games'):
-                    headers = gamelog.get('headers', [])
-                    games = gamelog['games']
-                    agg = aggregate_stats(games, headers)
-                    
-                    comparison_data.append({
-                        'name': player['display_name'],
-                        'team': player.get('team_abbr', 'FA'),
-                        'position': position,
-                        'games': len(games),
-                        'averages': agg['averages'],
-                        'totals': agg['totals'],
-                        'headers': headers
-                    })
-                else:
+            # Fetch both players' gamelogs concurrently (pure I/O wait)
+            with ThreadPoolExecutor(max_workers=len(players)) as pool:
+                gamelogs = list(pool.map(
+                    lambda p: process_player_gamelog(p['espn_id'], season, season_type=intent["season_type"], position=p.get('position', 'QB')),
+                    players
+                ))
+            
+            # Bail out before aggregating anything if either player has no games
+            for player, gamelog in zip(players, gamelogs):
+                if not gamelog.get('games'):
                     console.print(f"[yellow]No data found for {player['display_name']} in {season}.[/yellow]")
                     return
             
+            comparison_data = []
+            for player, gamelog in zip(players, gamelogs):
+                headers = gamelog.get('headers', [])
+                games = gamelog['games']
+                agg = aggregate_stats(games, headers)
+                
+                comparison_data.append({
+                    'name': player['display_name'],
+                    'team': player.get('team_abbr', 'FA'),
+                    'position': player.get('position', 'QB'),
+                    'games': len(games),
+                    'averages': agg['averages'],
+                    'totals': agg['totals'],
+                    'headers': headers
+                })
+            
             # Display comparison table
             if len(comparison_data) == 2:
                 p1, p2 = comparison_data
@@ -201,17 +370,11 @@ def process_query(full_query: str, use_spinner: bool = True):
                         val1 = p1['averages'][header]
                         val2 = p2['averages'][header]
                         
-                        # Determine winner (higher is better for most stats, except INT)
-                        if header == 'INT':
-                            winner = "🔵" if val2 > val1 else "🟢" if val1 > val2 else "🟡"
-                        else:
-                            winner = "🟢" if val1 > val2 else "🔵" if val2 > val1 else "🟡"
-                        
                         table.add_row(
                             header,
                             f"{val1:.1f}",
                             f"{val2:.1f}",
-                            winner
+                            _comparison_winner(val1, val2, header in _LOWER_IS_BETTER)
                         )
                 
                 # Add games played
@@ -219,7 +382,7 @@ def process_query(full_query: str, use_spinner: bool = True):
                     "Games",
                     str(p1['games']),
                     str(p2['games']),
-                    "🟢" if p1['games'] > p2['games'] else "🔵" if p2['games'] > p1['games'] else "🟡"
+                    _comparison_winner(p1['games'], p2['games'])
                 )
                 
                 console.print(table)
@@ -254,17 +417,16 @@ def process_query(full_query: str, use_spinner: bool = True):
             console.print(f"[bold cyan]Aggregating {team_entity.get('name')} {position_name}...[/bold cyan]")
             
             # Load all players and filter by team + position
-            players = load_players()
-            team_players = [p for p in players if p.get('team_abbr') == team_entity['abbr'] and p.get('position') in positions]
+            team_players = [p for p in load_players_by_team().get(team_entity['abbr'], []) if p.get('position') in positions]
             
             if not team_players:
                 console.print(f"[yellow]No {position_name} found for {team_entity.get('name')}.[/yellow]")
                 return
             
-            console.print(f"[dim]Found {len(team_players)} players: {', '.join([p['display_name'] for p in team_players[:5]])}{'...' if len(team_players) > 5 else ''}[/dim]")
+            console.print(f"[dim]Found {len(team_players)} players: {', '.join([p['display_name'] for p in islice(team_players, 5)])}{'...' if len(team_players) > 5 else ''}[/dim]")
             
             # Aggregate stats for all players
-            all_games = []
+            player_games = []
             last_headers = []
             
             if use_spinner:
@@ -273,20 +435,26 @@ def process_query(full_query: str, use_spinner: bool = True):
                 status_ctx = nullcontext()
             
             with status_ctx:
-                for player in team_players:
-                    # Get current season stats
-                    gamelog = process_player_gamelog(player['espn_id'], season, season_type=intent["season_type"], position=player.get('position', positions[0]))
+                # Fetch every player's gamelog concurrently; map keeps roster order
+                with ThreadPoolExecutor(max_workers=min(len(team_players), 16)) as pool:
+                    gamelogs = list(pool.map(
+                        lambda p: process_player_gamelog(p['espn_id'], season, season_type=intent["season_type"], position=p.get('position', positions[0])),
+                        team_players
+                    ))
+                
+                for gamelog in gamelogs:
                     if gamelog.get('games'):
                         if gamelog.get('headers') and not last_headers:
                             last_headers = gamelog['headers']
-                        all_games.extend(gamelog['games'])
+                        player_games.append(gamelog['games'])
             
-            if all_games:
+            if player_games:
                 if not last_headers:
-                    from .logic import get_headers_for_position
                     last_headers = get_headers_for_position(positions[0])
                 
-                agg = aggregate_stats(all_games, last_headers)
+                # Aggregated per player list; the games are never merged into one list
+                agg = aggregate_game_lists(player_games, last_headers)
+                game_count = sum(map(len, player_games))
                 
                 table = Table(title=f"{team_entity.get('name')} {position_name.title()} - Combined Stats ({season})")
                 table.add_column("Stat")
@@ -298,7 +466,7 @@ def process_query(full_query: str, use_spinner: bool = True):
                         table.add_row(h, f"{agg['totals'][h]:.0f}", f"{agg['averages'][h]:.1f}")
                 
                 console.print(table)
-                console.print(f"[dim]Combined from {len(team_players)} players across {len(all_games)} games[/dim]")
+                console.print(f"[dim]Combined from {len(team_players)} players across {game_count} games[/dim]")
                 
                 return {
                     "type": "multi_player",
@@ -311,7 +479,7 @@ def process_query(full_query: str, use_spinner: bool = True):
                             "averages": agg['averages'],
                             "headers": last_headers
                         },
-                        "games": len(all_games),
+                        "games": game_count,
                         "season": season
                     }
                 }
@@ -323,8 +491,6 @@ def process_query(full_query: str, use_spinner: bool = True):
         if intent.get("is_trending"):
             console.print(f"[bold cyan]Fetching trending players...[/bold cyan]")
             
-            from .fantasy import get_trending_players
-            
             trending_adds = get_trending_players(type='add', limit=10)
             
             if trending_adds:
@@ -335,14 +501,12 @@ def process_query(full_query: str, use_spinner: bool = True):
                 table.add_column("Team")
                 table.add_column("Adds")
                 
-                for i, player in enumerate(trending_adds, 1):
-                    table.add_row(
-                        str(i),
-                        player['name'],
-                        player.get('position', 'N/A'),
-                        player.get('team', 'FA'),
-                        str(player.get('count', 0))
-                    )
+                rows = (
+                    (str(i), player['name'], player.get('position', 'N/A'), player.get('team', 'FA'), str(player.get('count', 0)))
+                    for i, player in enumerate(trending_adds, 1)
+                )
+                for row in rows:
+                    table.add_row(*row)
                 
                 console.print(table)
                 
@@ -370,7 +534,6 @@ def process_query(full_query: str, use_spinner: bool = True):
             position = intent.get("roster_position")
             
             # Get CURRENT depth chart from ESPN API (has correct starter order)
-            from .api import get_team_depthchart
             depthchart_data = get_team_depthchart(team_entity['id'])
             
             if not depthchart_data or 'depthchart' not in depthchart_data:
@@ -379,14 +542,11 @@ def process_query(full_query: str, use_spinner: bool = True):
             
             # Parse depth chart data (already in correct depth order!)
             # depthchart is a list of formations, we'll use the first one (base formation)
-            all_players = []
-            seen_players = set()  # Track to avoid duplicates
-            depth_order_counter = 0  # Track original depth chart order
+            # Keyed by ESPN id to skip duplicates; insertion order preserves depth chart order
+            roster = {}
             
-            # Load players for enrichment
-            from .data import load_players
-            cached_players = load_players()
-            player_map = {p['espn_id']: p for p in cached_players if p.get('espn_id')}
+            # Cached players by ESPN id, for enrichment
+            player_map = load_players_by_id()
             
             formations = depthchart_data.get('depthchart', [])
             if formations:
@@ -400,61 +560,49 @@ def process_query(full_query: str, use_spinner: bool = True):
                         
                         for athlete_data in pos_data.get('athletes', []):
                             player_id = athlete_data.get('id')
-                            if player_id in seen_players:
+                            if player_id in roster:
                                 continue
-                            seen_players.add(player_id)
                             
                             # Get cached details if available
                             cached_p = player_map.get(player_id, {})
+                            experience = athlete_data.get('experience') or {}
+                            college = athlete_data.get('college') or {}
+                            status = athlete_data.get('status') or {}
                             
                             # Format height if available
-                            from .bio import format_height
-                            raw_height = cached_p.get('height') or athlete_data.get('displayHeight', '')
-                            formatted_height = format_height(raw_height) if str(raw_height).isdigit() else raw_height
+                            formatted_height = format_height(cached_p.get('height') or athlete_data.get('displayHeight', ''))
                             
-                            player = {
+                            roster[player_id] = {
                                 'display_name': athlete_data.get('displayName', ''),
                                 'position': position_name,
                                 'jersey': cached_p.get('jersey') or athlete_data.get('jersey', ''),
-                                'experience': cached_p.get('years_exp') or (athlete_data.get('experience', {}).get('years', 0) if athlete_data.get('experience') else 0),
-                                'college': cached_p.get('college') or (athlete_data.get('college', {}).get('name', '') if athlete_data.get('college') else ''),
+                                'experience': cached_p.get('years_exp') or experience.get('years', 0),
+                                'college': cached_p.get('college') or college.get('name', ''),
                                 'height': formatted_height,
                                 'weight': cached_p.get('weight') or athlete_data.get('displayWeight', ''),
-                                'status': cached_p.get('status') or (athlete_data.get('status', {}).get('type', '') if athlete_data.get('status') else ''),
+                                'status': cached_p.get('status') or status.get('type', ''),
                                 'rookie_season': cached_p.get('rookie_season'),
-                                'headshot_url': cached_p.get('headshot_url') or athlete_data.get('headshot', {}).get('href', ''),
-                                'depth_order': depth_order_counter  # Preserve original ESPN depth chart order
+                                'headshot_url': cached_p.get('headshot_url') or (athlete_data.get('headshot') or {}).get('href', ''),
+                                'depth_order': len(roster)  # Preserve original ESPN depth chart order
                             }
-                            all_players.append(player)
-                            depth_order_counter += 1
+            
+            all_players = list(roster.values())
             
             if not position:
                 # Show full roster grouped by position
                 console.print(f"[bold cyan]{team_entity.get('name')} Current Roster[/bold cyan]\n")
                 
                 # Group by position
-                from collections import defaultdict
                 by_position = defaultdict(list)
                 for p in all_players:
                     pos = p.get('position', 'N/A')
                     by_position[pos].append(p)
                 
-                # Display by position group
-                position_order = ['QB', 'RB', 'WR', 'TE', 'OL', 'C', 'G', 'T', 'DL', 'DE', 'DT', 'LB', 'CB', 'S', 'DB', 'K', 'P', 'LS']
-                
-                for pos in position_order:
-                    if pos in by_position:
-                        players_at_pos = by_position[pos]
-                        console.print(f"[cyan]{pos}:[/cyan] {', '.join([p['display_name'] for p in players_at_pos[:8]])}")
-                        if len(players_at_pos) > 8:
-                            console.print(f"[dim]  + {len(players_at_pos) - 8} more[/dim]")
-                
-                # Show any other positions
-                other_positions = set(by_position.keys()) - set(position_order)
-                if other_positions:
-                    for pos in sorted(other_positions):
-                        players_at_pos = by_position[pos]
-                        console.print(f"[cyan]{pos}:[/cyan] {', '.join([p['display_name'] for p in players_at_pos[:8]])}")
+                # Display by position group, known groups first then any others alphabetically
+                for pos, players_at_pos in sorted(by_position.items(), key=_roster_position_key):
+                    console.print(f"[cyan]{pos}:[/cyan] {', '.join([p['display_name'] for p in islice(players_at_pos, 8)])}")
+                    if len(players_at_pos) > 8 and pos in _POSITION_RANK:
+                        console.print(f"[dim]  + {len(players_at_pos) - 8} more[/dim]")
                 
                 console.print(f"\n[dim]Total players: {len(all_players)}[/dim]")
                 
@@ -475,19 +623,8 @@ def process_query(full_query: str, use_spinner: bool = True):
             else:
                 console.print(f"[bold cyan]Finding {team_entity.get('name')} {position}...[/bold cyan]")
             
-            # Handle position aliases (ESPN depth chart uses specific positions)
-            # e.g., "S" (Safety) should match both "SS" (Strong Safety) and "FS" (Free Safety)
-            position_aliases = {
-                'S': ['SS', 'FS', 'S'],  # Safety includes Strong and Free Safety
-                'DB': ['CB', 'SS', 'FS', 'S', 'DB'],  # Defensive Back includes all secondary
-                'LB': ['WLB', 'SLB', 'LILB', 'RILB', 'MLB', 'OLB', 'ILB', 'LB'],  # Linebacker includes all LB variants
-                'DL': ['DE', 'DT', 'NT', 'DL'],  # Defensive Line
-                'OL': ['C', 'G', 'T', 'OL'],  # Offensive Line
-                'K': ['PK', 'K'],  # Kicker (ESPN uses PK for Place Kicker)
-            }
-            
-            # Get list of positions to check
-            positions_to_check = position_aliases.get(position, [position])
+            # Get set of positions to check (aliases cover ESPN's specific depth chart positions)
+            positions_to_check = _POSITION_ALIASES.get(position) or frozenset((position,))
             
             team_players = [p for p in all_players if p.get('position') in positions_to_check]
             
@@ -525,11 +662,10 @@ def process_query(full_query: str, use_spinner: bool = True):
                         return
                 
                 # Check if this is a generic position query that maps to multiple specific positions
-                is_generic_position = position in position_aliases and len(positions_to_check) > 1
+                is_generic_position = position in _POSITION_ALIASES and len(positions_to_check) > 1
                 
                 if is_generic_position:
                     # Group by specific position and show all
-                    from collections import defaultdict
                     by_position = defaultdict(list)
                     for p in team_players:
                         by_position[p.get('position', 'N/A')].append(p)
@@ -570,11 +706,10 @@ def process_query(full_query: str, use_spinner: bool = True):
                 
                 # Show other players at this position if any
                 if len(team_players) > 1:
-                    console.print(f"[dim]Other {position}s on roster: {', '.join([p['display_name'] for p in team_players[1:]])}[/dim]")
+                    console.print(f"[dim]Other {position}s on roster: {', '.join([p['display_name'] for p in islice(team_players, 1, None)])}[/dim]")
             else:
                 # Show what positions ARE available
-                players = load_players()
-                all_team_players = [p for p in players if p.get('team_abbr') == team_entity['abbr']]
+                all_team_players = load_players_by_team().get(team_entity['abbr'], [])
                 available_positions = set(p.get('position') for p in all_team_players if p.get('position'))
                 
                 console.print(f"[dim]Available positions on roster: {', '.join(sorted(available_positions))}[/dim]")
@@ -593,9 +728,6 @@ def process_query(full_query: str, use_spinner: bool = True):
         
         # Handle General League Awards (e.g. "2024 MVP") where no player is specified
         if not entity and intent.get("is_awards"):
-            from .api import search_web, get_season_awards_wiki
-            from rich.panel import Panel as AwardsPanel
-            import re
             
             award_type = intent.get("award_type", "MVP")
             season = intent.get("season", "2024")
@@ -608,26 +740,16 @@ def process_query(full_query: str, use_spinner: bool = True):
             
             # If Wikipedia doesn't have it, try NFL.com
             if not wiki_awards:
-                from .api import get_season_awards_nflcom
                 wiki_awards = get_season_awards_nflcom(season)
             
             if wiki_awards:
-                # Fuzzy match award type against keys in wiki_awards
-                from rapidfuzz import process, fuzz
-                # Map common abbreviations to full names if needed, but fuzzy match might handle it
-                # MVP -> Most Valuable Player
-                # OPOY -> Offensive Player of the Year
-                award_map = {
-                    'MVP': 'Most Valuable Player',
-                    'OPOY': 'Offensive Player of the Year',
-                    'DPOY': 'Defensive Player of the Year',
-                    'OROY': 'Offensive Rookie of the Year',
-                    'DROY': 'Defensive Rookie of the Year',
-                    'CPOY': 'Comeback Player of the Year'
-                }
-                search_key = award_map.get(award_type, award_type)
+                # Match the award against keys in wiki_awards: exact full name first, fuzzy otherwise
+                search_key = _AWARD_NAMES.get(award_type, award_type)
                 
-                match = process.extractOne(search_key, wiki_awards.keys(), scorer=fuzz.WRatio)
+                if search_key in wiki_awards:
+                    match = (search_key, 100)
+                else:
+                    match = process.extractOne(search_key, wiki_awards.keys(), scorer=fuzz.WRatio)
                 if match and match[1] > 80:
                     winner_name = wiki_awards[match[0]]
                     
@@ -655,25 +777,14 @@ def process_query(full_query: str, use_spinner: bool = True):
                 # Attempt to extract winner name
                 winner_name = None
                 
-                # Common patterns for award winners in news snippets
-                # e.g. "Josh Allen won the 2024 NFL MVP"
-                # e.g. "Lamar Jackson named 2023 MVP"
-                patterns = [
-                    r'([A-Z][a-z]+ [A-Z][a-z]+) (?:won|wins|named|voted|awarded|takes home) (?:the )?(?:{season} )?(?:NFL )?{award}'.format(season=season, award=award_type),
-                    r'(?:{season} )?(?:NFL )?{award} (?:winner|recipient) (?:is|was) ([A-Z][a-z]+ [A-Z][a-z]+)'.format(season=season, award=award_type),
-                    r'([A-Z][a-z]+ [A-Z][a-z]+) (?:beats|edges|tops|defeats) .*? (?:for|in) (?:the )?.*?{award}'.format(award=award_type),
-                    r'([A-Z][a-z]+ [A-Z][a-z]+) (?:is|named) (?:the )?{season} (?:NFL )?{award}'.format(season=season, award=award_type),
-                    r'([A-Z][a-z]+ [A-Z][a-z]+) (?:wins) (?:the )?{award}'.format(award=award_type)
-                ]
-                
-                for pattern in patterns:
-                    match = re.search(pattern, results, re.IGNORECASE)
+                for pattern in _award_winner_patterns(season, award_type):
+                    match = pattern.search(results)
                     if match:
                         winner_name = match.group(1)
                         # Clean up name (remove common prefixes/suffixes if caught)
-                        winner_name = re.sub(r'^(Bills|Chiefs|Ravens|Eagles|QB|WR|RB|The)\s+', '', winner_name, flags=re.IGNORECASE)
+                        winner_name = _WINNER_PREFIX_RE.sub('', winner_name)
                         # Remove trailing punctuation
-                        winner_name = re.sub(r'[.,;:]$', '', winner_name)
+                        winner_name = _TRAILING_PUNCT_RE.sub('', winner_name)
                         break
                 
                 if winner_name:
@@ -702,7 +813,6 @@ def process_query(full_query: str, use_spinner: bool = True):
         if not entity:
             # Handle General Draft Queries (e.g., "2024 first round draft")
             if intent.get("is_draft"):
-                from .draft import search_draft_picks
                 
                 season = intent.get("season", "2024")
                 draft_round = intent.get("draft_round")
@@ -765,7 +875,6 @@ def process_query(full_query: str, use_spinner: bool = True):
         console.print(f"[green]Found {entity_type}: {entity.get('display_name') or entity.get('name')}[/green]")
         
         if intent.get("is_draft") and entity_type == 'player':
-            from .draft import get_player_draft_info
             
             draft_info = get_player_draft_info(entity['display_name'])
             
@@ -791,31 +900,30 @@ def process_query(full_query: str, use_spinner: bool = True):
         
         # Handle Biographical Queries
         if intent.get("is_bio") and entity_type == 'player':
-            from .bio import get_player_bio, format_height
             
             bio = get_player_bio(entity['display_name'])
             
             if bio:
-                panel_content = f"""
+                parts = [f"""
 **Name**: {bio.get('name', 'N/A')}
 **Position**: {bio.get('position', 'N/A')}
 **Team**: {bio.get('team', 'N/A')}
 **Status**: {bio.get('status', 'N/A')}
-"""
+"""]
                 if bio.get('age'):
-                    panel_content += f"**Age**: {bio['age']}\n"
+                    parts.append(f"**Age**: {bio['age']}\n")
                 if bio.get('college'):
-                    panel_content += f"**College**: {bio['college']}\n"
+                    parts.append(f"**College**: {bio['college']}\n")
                 if bio.get('height'):
-                    panel_content += f"**Height**: {format_height(bio['height'])}\n"
+                    parts.append(f"**Height**: {format_height(bio['height'])}\n")
                 if bio.get('weight'):
-                    panel_content += f"**Weight**: {bio['weight']} lbs\n"
+                    parts.append(f"**Weight**: {bio['weight']} lbs\n")
                 if bio.get('years_exp'):
-                    panel_content += f"**Experience**: {bio['years_exp']} years\n"
+                    parts.append(f"**Experience**: {bio['years_exp']} years\n")
                 if bio.get('rookie_season'):
-                    panel_content += f"**Rookie Season**: {bio['rookie_season']}\n"
+                    parts.append(f"**Rookie Season**: {bio['rookie_season']}\n")
                 
-                console.print(Panel(panel_content, title=f"👤 Player Profile - {entity['display_name']}"))
+                console.print(Panel("".join(parts), title=f"👤 Player Profile - {entity['display_name']}"))
                 
                 return {
                     "type": "bio",
@@ -828,41 +936,26 @@ def process_query(full_query: str, use_spinner: bool = True):
         
         # Handle MVP/Awards Queries
         if intent.get("is_awards") and entity_type == 'player':
-            from .api import search_web
-            from rich.panel import Panel as AwardsPanel
-            import re
             
             award_type = intent.get("award_type")  # Don't default to MVP
             player_name = entity['display_name']
             
             # Try Wikipedia first for reliable awards data
-            from .api import get_player_awards_wiki
             wiki_awards = get_player_awards_wiki(player_name)
             
             relevant_awards = []
             if wiki_awards:
                 # If a specific award type was requested, filter for it
                 if award_type:
-                    # Map award_type to keywords
-                    keywords = [award_type]
-                    if award_type == "MVP":
-                        keywords.append("Most Valuable Player")
-                    elif award_type == "OPOY":
-                        keywords.append("Offensive Player of the Year")
-                    elif award_type == "DPOY":
-                        keywords.append("Defensive Player of the Year")
-                    elif award_type == "OROY":
-                        keywords.append("Offensive Rookie of the Year")
-                    elif award_type == "DROY":
-                        keywords.append("Defensive Rookie of the Year")
-                    elif award_type == "CPOY":
-                        keywords.append("Comeback Player of the Year")
+                    # Match on the abbreviation and, for the known awards, the full name
+                    keywords = [award_type.lower()]
+                    if award_type in _AWARD_NAMES:
+                        keywords.append(_AWARD_NAMES[award_type].lower())
                     
                     for award in wiki_awards:
-                        for kw in keywords:
-                            if kw.lower() in award.lower():
-                                relevant_awards.append(award)
-                                break
+                        award_lower = award.lower()
+                        if any(kw in award_lower for kw in keywords):
+                            relevant_awards.append(award)
                 else:
                     # No specific award type - show ALL awards
                     relevant_awards = wiki_awards
@@ -870,24 +963,19 @@ def process_query(full_query: str, use_spinner: bool = True):
             if relevant_awards:
                 # Filter out college/non-NFL awards if user specified "nfl awards"
                 if "nfl" in full_query.lower():
-                    nfl_awards = []
-                    nfl_keywords = ["nfl", "pro bowl", "all-pro", "super bowl"]
-                    for award in relevant_awards:
-                        award_lower = award.lower()
-                        if any(kw in award_lower for kw in nfl_keywords):
-                            nfl_awards.append(award)
+                    nfl_awards = [award for award in relevant_awards if _NFL_KW_RE.search(award)]
                     if nfl_awards:
                         relevant_awards = nfl_awards
                 
                 title_text = f"{player_name} - {award_type} Awards" if award_type else f"{player_name} - All Awards"
-                display_content = f"""
+                display_content = "".join((
+                    f"""
 [bold gold1]🏆 {title_text}[/bold gold1]
 
-"""
-                for award in relevant_awards:
-                    display_content += f"• {award}\n"
-                
-                display_content += f"\n[dim]Source: Wikipedia[/dim]"
+""",
+                    "".join(f"• {award}\n" for award in relevant_awards),
+                    "\n[dim]Source: Wikipedia[/dim]",
+                ))
                 
                 console.print(Panel(display_content, title=f"🏆 {player_name} Awards"))
                 
@@ -930,105 +1018,81 @@ def process_query(full_query: str, use_spinner: bool = True):
             results = search_web(search_query)
             
             if results:
+                # Truncated copy of the results for the panel and the returned data
+                results_excerpt = results[:400] + "..." if len(results) > 400 else results
+                
                 # Parse results to extract years - be EXTREMELY strict to avoid false positives
-                years = []
+                years = set()
                 
                 # Also check titles and URLs which often have the year
                 # Pattern: "wins 2018 NFL MVP" in title or URL
-                title_url_pattern = r'(?:wins?|won|earned?).*?(\d{4}).*?(?:MVP|most.*?valuable)'
-                title_matches = re.findall(title_url_pattern, results, re.IGNORECASE)
-                for year_str in title_matches:
+                for title_match in _TITLE_URL_MVP_RE.finditer(results):
+                    year_str = title_match.group(1)
                     year = int(year_str)
                     if 1957 <= year <= 2024:
-                        # Make sure it's not a draft year by checking context
-                        context = results[max(0, results.find(year_str)-100):min(len(results), results.find(year_str)+100)]
-                        if 'draft' not in context.lower() and 'heisman' not in context.lower():
-                            if year not in years:
-                                years.append(year)
-                
-                # Look for very specific patterns that indicate actually winning MVP
-                win_patterns = [
-                    r'won.*?MVP.*?(?:in|for).*?(\d{4})',  # "won MVP in 2019"
-                    r'(\d{4}).*?MVP.*?(?:winner|award|season)',  # "2019 MVP winner"
-                    r'MVP.*?(\d{4}).*?(?:winner|season)',  # "MVP 2019 winner"
-                    r'earned.*?MVP.*?(\d{4})',  # "earned MVP in 2019"
-                    r'named.*?MVP.*?(\d{4})',  # "named MVP in 2019"
-                ]
-                
-                # Exclude patterns
-                exclude_patterns = [
-                    r'favorite.*?MVP',
-                    r'could.*?MVP',
-                    r'predict.*?MVP',
-                    r'candidate.*?MVP',
-                    r'odds.*?MVP',
-                    r'to win.*?MVP',
-                    r'makes.*?case.*?MVP',
-                ]
-                
-                # Split into sentences
-                sentences = results.replace('\n', ' ').split('.')
-                
-                for sentence in sentences:
+                        # Make sure it's not a draft year by checking the context around this match's year
+                        pos = title_match.start(1)
+                        context = results[max(0, pos-100):pos+100]
+                        if not _DRAFT_CONTEXT_RE.search(context):
+                            years.add(year)
+                
+                # Walk the sentences lazily instead of copying and splitting the whole blob
+                for sentence_match in _SENTENCE_RE.finditer(results):
+                    sentence = sentence_match.group()
+                    
+                    # Only sentences that mention MVP and contain a 4-digit year can yield one;
+                    # check that first so most sentences skip the pattern scans entirely
+                    if 'MVP' not in sentence.upper() or not _YEAR_TOKEN_RE.search(sentence):
+                        continue
+                    
                     # Skip sentences with prediction/candidate language
-                    if any(re.search(pattern, sentence, re.IGNORECASE) for pattern in exclude_patterns):
+                    if _MVP_EXCLUDE_RE.search(sentence):
                         continue
                     
                     # Skip sentences with draft/college mentions
-                    if any(word in sentence.lower() for word in ['draft', 'heisman', 'lsu', 'national championship']):
+                    if _COLLEGE_NOISE_RE.search(sentence):
                         continue
                     
-                    # Only process sentences that mention MVP
-                    if 'MVP' in sentence.upper():
-                        # Try each win pattern
-                        for pattern in win_patterns:
-                            matches = re.findall(pattern, sentence, re.IGNORECASE)
-                            for year_str in matches:
-                                year = int(year_str)
-                                if 1957 <= year <= 2024 and year not in years:
-                                    years.append(year)
-                
-                years = list(set(years))  # Remove duplicates
-                years.sort()
+                    # Try each win pattern
+                    for pattern in _MVP_WIN_PATTERNS:
+                        for year_str in pattern.findall(sentence):
+                            year = int(year_str)
+                            if 1957 <= year <= 2024:
+                                years.add(year)
+                
+                years = sorted(years)
                 
                 # Create definitive answer
-                panel_content = f"**Player**: {player_name}\n"
-                panel_content += f"**Award**: {award_type}\n\n"
+                parts = [f"**Player**: {player_name}\n", f"**Award**: {award_type}\n\n"]
                 
                 if years:
                     if len(years) == 1:
-                        panel_content += f"🏆 **Won {award_type} in: {years[0]}**\n\n"
+                        parts.append(f"🏆 **Won {award_type} in: {years[0]}**\n\n")
                     else:
-                        panel_content += f"🏆 **{award_type} Awards Won:**\n"
-                        for i, year in enumerate(years, 1):
-                            if i == 1:
-                                panel_content += f"   • **{year}** (First {award_type})\n"
-                            else:
-                                panel_content += f"   • {year}\n"
-                        panel_content += f"\n**Total: {len(years)} {award_type} award(s)**\n\n"
+                        parts.append(f"🏆 **{award_type} Awards Won:**\n")
+                        parts.append(f"   • **{years[0]}** (First {award_type})\n")
+                        parts.extend(f"   • {year}\n" for year in years[1:])
+                        parts.append(f"\n**Total: {len(years)} {award_type} award(s)**\n\n")
                     
                     # Add context from search results (truncated)
-                    panel_content += "**Details:**\n"
-                    panel_content += results[:400] + "..." if len(results) > 400 else results
+                    parts.append("**Details:**\n")
+                    parts.append(results_excerpt)
                 else:
                     # No MVP awards found
-                    panel_content += f"❌ **No {award_type} awards found**\n\n"
+                    parts.append(f"❌ **No {award_type} awards found**\n\n")
                     
                     # Check if search results look relevant (contain NFL/MVP keywords)
-                    results_lower = results.lower()
-                    is_relevant = any(keyword in results_lower for keyword in ['nfl', 'football', 'quarterback', 'mvp'])
-                    
-                    if is_relevant:
-                        panel_content += f"{player_name} has not won an NFL {award_type} award.\n\n"
-                        panel_content += "**Search Results:**\n"
-                        panel_content += results[:400] + "..." if len(results) > 400 else results
+                    if _RELEVANCE_RE.search(results):
+                        parts.append(f"{player_name} has not won an NFL {award_type} award.\n\n")
+                        parts.append("**Search Results:**\n")
+                        parts.append(results_excerpt)
                     else:
                         # Search results are junk/irrelevant
-                        panel_content += f"Based on available data, **{player_name} has not won an NFL {award_type} award**.\n\n"
-                        panel_content += f"*Note: {player_name} may have won other awards such as Comeback Player of the Year, Pro Bowl selections, or All-Pro honors.*"
+                        parts.append(f"Based on available data, **{player_name} has not won an NFL {award_type} award**.\n\n")
+                        parts.append(f"*Note: {player_name} may have won other awards such as Comeback Player of the Year, Pro Bowl selections, or All-Pro honors.*")
                 
-                console.print(AwardsPanel(
-                    panel_content,
+                console.print(Panel(
+                    "".join(parts),
                     title=f"🏆 {award_type} Award Information",
                     border_style="yellow"
                 ))
@@ -1037,8 +1101,8 @@ def process_query(full_query: str, use_spinner: bool = True):
                     "type": "awards",
                     "data": {
                         "award": award_type,
-                        "years": years if 'years' in locals() else [],
-                        "results": results[:400] + "..." if len(results) > 400 else results
+                        "years": years,
+                        "results": results_excerpt
                     },
                     "player": entity
                 }
@@ -1049,21 +1113,20 @@ def process_query(full_query: str, use_spinner: bool = True):
         
         # Handle Injury Queries
         if intent.get("is_injury") and entity_type == 'player':
-            from .bio import get_injury_status
             
             injury = get_injury_status(entity['display_name'])
             
             if injury and injury.get('status'):
                 status_emoji = "🟢" if injury['status'].lower() == 'healthy' else "🔴"
-                panel_content = f"""
+                parts = [f"""
 {status_emoji} **Status**: {injury.get('status', 'Unknown')}
-"""
+"""]
                 if injury.get('body_part'):
-                    panel_content += f"**Injury**: {injury['body_part']}\n"
+                    parts.append(f"**Injury**: {injury['body_part']}\n")
                 if injury.get('notes'):
-                    panel_content += f"**Notes**: {injury['notes']}\n"
+                    parts.append(f"**Notes**: {injury['notes']}\n")
                 
-                console.print(Panel(panel_content, title=f"🏥 Injury Status - {entity['display_name']}"))
+                console.print(Panel("".join(parts), title=f"🏥 Injury Status - {entity['display_name']}"))
                 
                 return {
                     "type": "injury",
@@ -1088,7 +1151,6 @@ def process_query(full_query: str, use_spinner: bool = True):
             stats = get_player_stats(entity['espn_id'], season)
             
             if stats and stats.get('statistics'):
-                from .fantasy_points import calculate_season_fantasy_points
                 
                 position = entity.get('position', 'RB')
                 fantasy_result = calculate_season_fantasy_points(stats, position)
@@ -1108,43 +1170,27 @@ def process_query(full_query: str, use_spinner: bool = True):
                     # Get the stats that are shown
                     categories = stats.get('statistics', {}).get('splits', {}).get('categories', [])
                     
-                    total_pts = 0
-                    breakdown_text = ""
-                    
+                    # Collect the scored stats, then price them all in one vectorized multiply
+                    labels, values, multipliers = [], [], []
                     for category in categories:
                         for stat in category.get('stats', []):
                             name = stat.get('displayName', '')
-                            value = float(stat.get('value', 0))
-                            
-                            # Calculate points based on stat
-                            if 'Rushing Yards' in name:
-                                pts = value * 0.1
-                                total_pts += pts
-                                breakdown_text += f"  • {name}: {pts:.1f} pts\n"
-                            elif 'Rushing Touchdowns' in name:
-                                pts = value * 6
-                                total_pts += pts
-                                breakdown_text += f"  • {name}: {pts:.1f} pts\n"
-                            elif 'Receiving Yards' in name:
-                                pts = value * 0.1
-                                total_pts += pts
-                                breakdown_text += f"  • {name}: {pts:.1f} pts\n"
-                            elif 'Receiving Touchdowns' in name or 'Rec TD' in name:
-                                pts = value * 6
-                                total_pts += pts
-                                breakdown_text += f"  • {name}: {pts:.1f} pts\n"
-                            elif 'Receptions' in name:
-                                pts = value * 1  # PPR
-                                total_pts += pts
-                                breakdown_text += f"  • {name} (PPR): {pts:.1f} pts\n"
-                            elif 'Passing Yards' in name:
-                                pts = value * 0.04
-                                total_pts += pts
-                                breakdown_text += f"  • {name}: {pts:.1f} pts\n"
-                            elif 'Passing Touchdowns' in name:
-                                pts = value * 4
-                                total_pts += pts
-                                breakdown_text += f"  • {name}: {pts:.1f} pts\n"
+                            rule = _fantasy_fallback_rule(name)
+                            if rule:
+                                multiplier, label_suffix = rule
+                                labels.append(f"{name}{label_suffix}")
+                                values.append(float(stat.get('value', 0)))
+                                multipliers.append(multiplier)
+                    
+                    point_array = np.multiply(values, multipliers)
+                    total_pts = float(point_array.sum())
+                    points = point_array.tolist()
+                    breakdown_text = "".join(f"  • {label}: {pts:.1f} pts\n" for label, pts in zip(labels, points))
+                    # Plain floats only, so the returned data serializes without NumPy scalars
+                    fantasy_result = {
+                        'total': total_pts,
+                        'breakdown': {label: round(pts, 1) for label, pts in zip(labels, points)}
+                    }
                     
                     if total_pts > 0:
                         panel_content = f"""
@@ -1160,269 +1206,12 @@ def process_query(full_query: str, use_spinner: bool = True):
                 return {
                     "type": "fantasy_points",
                     "data": {
-                        "total": fantasy_result.get('total', total_pts) if 'fantasy_result' in locals() else total_pts,
-                        "breakdown": fantasy_result.get('breakdown', {}) if 'fantasy_result' in locals() else {k.split(':')[0].replace('•', '').strip(): float(k.split(':')[1].replace('pts', '').strip()) for k in breakdown_text.strip().split('\n') if ':' in k},
+                        "total": fantasy_result['total'],
+                        "breakdown": fantasy_result['breakdown'],
                         "player": entity,
                         "season": season
                     }
                 }
-                # Fallback: Try to get from gamelog
-                console.print(f"[dim]Trying gamelog data...[/dim]")
-                
-                position = entity.get('position', 'RB')
-                gamelog = process_player_gamelog(entity['espn_id'], season, season_type=2, position=position)
-                
-                if gamelog and gamelog.get('games'):
-                    headers = gamelog.get('headers', [])
-                    games = gamelog['games']
-                    
-                    # Apply Filters (Opponent, Game Type, etc.)
-                    filtered_games = []
-                    
-                    # 1. Filter by Opponent
-                    target_opponent = None
-                    if intent.get("opponent_team"):
-                        target_opponent = intent["opponent_team"]
-                    elif intent.get("team_context") and intent["team_context"]['abbr'] != entity.get('team_abbr'):
-                        # If team context is different from player's team, treat as opponent
-                        target_opponent = intent["team_context"]
-                        
-                    if target_opponent:
-                        console.print(f"[dim]Filtering for games against {target_opponent['name']}...[/dim]")
-                        # We need to match games to opponents. 
-                        # Since gamelog doesn't have opponent info directly in the event, 
-                        # we rely on the 'team' field we added in logic.py or need to fetch schedule.
-                        # However, logic.py adds the PLAYER'S team to the event.
-                        # We need to fetch the team's schedule to identify opponents.
-                        
-                        team_id = entity.get('team_id') or (intent.get("team_context") or {}).get('id')
-                        if not team_id:
-                             # Try to find team from entity
-                             players = load_players()
-                             for p in players:
-                                 if p['id'] == entity['espn_id']:
-                                     team_id = p.get('team_id')
-                                     break
-                        
-                        if team_id:
-                            schedule = get_team_schedule(team_id, season)
-                            opponent_map = {} # game_id -> opponent_name
-                            
-                            if schedule and 'events' in schedule:
-                                for event in schedule['events']:
-                                    game_id = event['id']
-                                    competitions = event.get('competitions', [])
-                                    if competitions:
-                                        competitors = competitions[0].get('competitors', [])
-                                        for comp in competitors:
-                                            if comp.get('id') != team_id:
-                                                opponent_map[game_id] = comp.get('team', {}).get('displayName', '').lower()
-                            
-                            # Filter games
-                            for game in games:
-                                game_id = game.get('eventId')
-                                opponent = opponent_map.get(game_id, '')
-                                # Extract nickname from team name (e.g., "Dallas Cowboys" -> "cowboys")
-                                team_nickname = target_opponent['name'].split()[-1].lower()
-                                if target_opponent['name'].lower() in opponent or team_nickname in opponent or target_opponent['abbr'].lower() in opponent:
-                                    filtered_games.append(game)
-                        else:
-                            console.print("[yellow]Could not determine player's team to filter opponents.[/yellow]")
-                            filtered_games = games # Fallback
-                    else:
-                        filtered_games = games
-                        
-                    # 2. Filter by Game Type (Playoffs)
-                    if intent.get("is_playoffs") or intent.get("game_type"):
-                        if intent.get("is_playoffs"):
-                             gamelog_playoffs = process_player_gamelog(entity['espn_id'], season, season_type=3, position=position)
-                             if gamelog_playoffs and gamelog_playoffs.get('games'):
-                                 filtered_games = gamelog_playoffs['games']
-                                 headers = gamelog_playoffs.get('headers', [])
-                    
-                    # 3. Filter by Month / Prime Time
-                    if intent.get("month_filter") or intent.get("prime_time"):
-                        # We need schedule to check dates/times
-                        team_id = entity.get('team_id') or (intent.get("team_context") or {}).get('id')
-                        
-                        if not team_id:
-                             # Try to find team from entity
-                             players = load_players()
-                             for p in players:
-                                 if p['id'] == entity['espn_id']:
-                                     team_id = p.get('team_id')
-                                     break
-                        
-                        if team_id:
-                            schedule = get_team_schedule(team_id, season)
-                            game_details = {} # game_id -> {date: datetime, is_prime: bool}
-                            
-                            if schedule and 'events' in schedule:
-                                from dateutil import parser as date_parser
-                                import pytz
-                                
-                                for event in schedule['events']:
-                                    game_id = event['id']
-                                    date_str = event.get('date')
-                                    if date_str:
-                                        try:
-                                            dt = date_parser.parse(date_str)
-                                            # Convert to ET for prime time check (approximate)
-                                            # Prime time is usually > 7pm ET or > 4pm PT
-                                            # Or just check hour > 19 (7 PM)
-                                            # ISO format usually UTC. 7PM ET is 00:00 UTC next day.
-                                            # Let's assume prime time is after 6 PM local time (approx 23:00 UTC)
-                                            
-                                            is_prime = False
-                                            # Simple check: Hour in UTC. 
-                                            # 8:15 PM ET = 01:15 UTC next day
-                                            # 1:00 PM ET = 18:00 UTC
-                                            # 4:00 PM ET = 21:00 UTC
-                                            # So Prime Time is roughly 00:00 to 05:00 UTC
-                                            if dt.hour in [0, 1, 2, 3, 4, 23]: # Approx prime time window
-                                                is_prime = True
-                                                
-                                            game_details[game_id] = {
-                                                'month': dt.strftime("%B").lower(),
-                                                'is_prime': is_prime
-                                            }
-                                        except:
-                                            pass
-                            
-                            # Apply filters
-                            new_filtered = []
-                            for game in filtered_games:
-                                game_id = game.get('eventId')
-                                details = game_details.get(game_id)
-                                
-                                if details:
-                                    include = True
-                                    
-                                    # Month Filter
-                                    if intent.get("month_filter"):
-                                        target_month = intent["month_filter"].lower()
-                                        if details['month'] != target_month:
-                                            include = False
-                                    
-                                    # Prime Time Filter
-                                    if intent.get("prime_time"):
-                                        if not details['is_prime']:
-                                            include = False
-                                            
-                                    if include:
-                                        new_filtered.append(game)
-                                else:
-                                    # If we can't find details, maybe include? Or exclude?
-                                    # Safer to exclude if strict filter
-                                    pass
-                                    
-                            filtered_games = new_filtered
-                            console.print(f"[dim]Filtered to {len(filtered_games)} games based on time/date criteria.[/dim]")
-                        else:
-                            console.print("[yellow]Could not determine team schedule for time filters.[/yellow]")
-
-                    games = filtered_games
-                    
-                    if not games:
-                        console.print(f"[yellow]No games found matching filters for {entity['display_name']} in {season}.[/yellow]")
-                        return
-
-                    # Aggregate all games
-                    agg = aggregate_stats(games, headers)
-                    totals = agg.get('totals', {})
-                    unique_headers = agg.get('headers', headers)
-                    
-                    # Calculate fantasy points from totals
-                    total_pts = 0
-                    breakdown_text = ""
-                    # Context-aware mapping
-                    # We need to know which 'Yds' or 'TD' belongs to which category
-                    # We'll iterate through headers to track context
-                    current_context = 'passing' if position == 'QB' else 'rushing' # Default start
-                    
-                    # Calculate fantasy points from totals
-                    total_pts = 0
-                    breakdown_text = ""
-                    
-                    # Context-aware mapping
-                    # We need to know which 'Yds' or 'TD' belongs to which category
-                    # We'll iterate through headers to track context
-                    current_context = 'passing' if position == 'QB' else 'rushing' # Default start
-                    
-                    for i, header in enumerate(unique_headers):
-                        base_header = header.split('.')[0]
-                        value = totals.get(header, 0)
-                        
-                        # Detect context changes based on adjacent headers
-                        if base_header in ['Cmp', 'Att', 'Pas']:
-                            current_context = 'passing'
-                        elif base_header in ['Rush', 'Car']:
-                            current_context = 'rushing'
-                        elif base_header in ['Rec', 'Tgt']:
-                            current_context = 'receiving'
-                            
-                        # Calculate points based on context
-                        if base_header in ['Yds', 'Yards']:
-                            if current_context == 'rushing':
-                                pts = value * 0.1
-                                if pts > 0:
-                                    total_pts += pts
-                                    breakdown_text += f"  • Rushing Yards ({value:.0f}): {pts:.1f} pts\n"
-                            elif current_context == 'receiving':
-                                pts = value * 0.1
-                                if pts > 0:
-                                    total_pts += pts
-                                    breakdown_text += f"  • Receiving Yards ({value:.0f}): {pts:.1f} pts\n"
-                            elif current_context == 'passing':
-                                pts = value * 0.04
-                                if pts > 0:
-                                    total_pts += pts
-                                    breakdown_text += f"  • Passing Yards ({value:.0f}): {pts:.1f} pts\n"
-                                    
-                        elif base_header in ['TD', 'Touchdowns']:
-                            if current_context == 'passing':
-                                pts = value * 4
-                            else:
-                                pts = value * 6
-                                
-                            if pts > 0:
-                                total_pts += pts
-                                context_label = current_context.title()
-                                breakdown_text += f"  • {context_label} TDs ({value:.0f}): {pts:.1f} pts\n"
-                                
-                        elif base_header in ['Rec', 'Receptions']:
-                            # Receptions (PPR)
-                            pts = value * 1
-                            if pts > 0:
-                                total_pts += pts
-                                breakdown_text += f"  • Receptions ({value:.0f}) (PPR): {pts:.1f} pts\n"
-                                
-                        elif base_header == 'INT':
-                            # Interceptions (negative for QB)
-                            pts = value * -2
-                            if pts != 0:
-                                total_pts += pts
-                                breakdown_text += f"  • Interceptions ({value:.0f}): {pts:.1f} pts\n"
-                                
-                        elif base_header == 'FUM':
-                            # Fumbles lost (approximate, usually just FUM total)
-                            # We'll assume half are lost if not specified? Or just ignore for safety
-                            pass
-                    
-                    if total_pts > 0:
-                        panel_content = f"""
-**Total Fantasy Points (PPR)**: {total_pts:.1f}
-**Games Played**: {len(games)}
-**Points Per Game**: {total_pts / len(games):.1f}
-
-**Breakdown:**
-{breakdown_text}
-"""
-                        console.print(Panel(panel_content, title=f"🏈 Fantasy Points - {entity['display_name']} ({season})"))
-                    else:
-                        console.print(f"[yellow]Could not calculate fantasy points from available data.[/yellow]")
-                else:
-                    console.print(f"[yellow]No stats available for {entity['display_name']} in {season}.[/yellow]")
             return
         
         # 3. Route Logic
@@ -1460,8 +1249,6 @@ def process_query(full_query: str, use_spinner: bool = True):
             # Handle "Longest" Queries
             if intent.get("is_longest"):
                 longest_type = intent.get("longest_type", 'any')
-                from .playbyplay import get_longest_play, get_player_active_seasons
-                
                 # Determine seasons to search
                 seasons_to_search = []
                 is_career_search = False
@@ -1500,11 +1287,14 @@ def process_query(full_query: str, use_spinner: bool = True):
                             if play['yards'] > best_yards:
                                 best_yards = play['yards']
                                 best_play = play
-                                # If we found a touchdown of 99 yards, we can stop early? 
-                                # No, theoretically could be multiple.
-                    except Exception as e:
-                        # console.print(f"[dim]Error checking {search_season}: {e}[/dim]")
+                    except Exception:
+                        # A failure in one season (network, nflverse/pandas fallback, malformed play data)
+                        # skips that season instead of ending the whole search
                         continue
+                    
+                    # Nothing beats a 99-yard touchdown (ties keep the earlier play), so skip the remaining seasons
+                    if best_yards >= _MAX_PLAY_YARDS and best_play.get('touchdown'):
+                        break
                 
                 if best_play:
                     # Create a nice display
@@ -1554,8 +1344,8 @@ def process_query(full_query: str, use_spinner: bool = True):
                     ))
                     
                     # Generate Animated Play Visualization
+                    animation_path = None
                     try:
-                        import os
                         
                         # Create filename for animation
                         filename = f"play_animation_{entity['display_name'].replace(' ', '_')}_{best_play.get('season')}_wk{best_play.get('week')}.gif"
@@ -1574,15 +1364,14 @@ def process_query(full_query: str, use_spinner: bool = True):
                         
                         # For now, use enhanced simulated animation which shows the CORRECT play
                         console.print(f"[dim]Creating enhanced animation with actual player names...[/dim]")
-                        from .visualizer import animate_play_progression
                         
                         if animate_play_progression(best_play, output_path):
+                            animation_path = filename
                             console.print(f"[bold green]✓ Play animation generated: [link=file://{output_path}]{filename}[/link][/bold green]")
                             console.print(f"[dim]   Showing: {best_play.get('description', '')[:80]}...[/dim]")
                         else:
                             console.print(f"[yellow]Could not generate animation, falling back to static diagram...[/yellow]")
                             # Fallback to static diagram
-                            from .visualizer import generate_play_diagram
                             static_filename = f"play_diagram_{entity['display_name'].replace(' ', '_')}_{best_play.get('season')}_wk{best_play.get('week')}.png"
                             static_path = os.path.abspath(static_filename)
                             if generate_play_diagram(best_play, static_path):
@@ -1593,6 +1382,11 @@ def process_query(full_query: str, use_spinner: bool = True):
 
                         
                     console.print(f"[dim]✓ Data from nflverse play-by-play[/dim]")
+                    
+                    return {
+                        "type": "longest_play",
+                        "animation_path": animation_path
+                    }
                 else:
                     console.print(f"[yellow]No {longest_type} plays found for {entity['display_name']}.[/yellow]")
                 
@@ -1603,9 +1397,6 @@ def process_query(full_query: str, use_spinner: bool = True):
                 quarter_num = intent.get("quarter_filter")
                 console.print(f"[bold magenta]Fetching Q{quarter_num} stats for {entity['display_name']} ({season})...[/bold magenta]")
                 
-                # Import play-by-play module with nflverse data
-                from .playbyplay import get_season_quarter_stats
-                
                 # Get aggregated quarter stats for the entire season
                 try:
                     quarter_stats = get_season_quarter_stats(
@@ -1776,7 +1567,6 @@ def process_query(full_query: str, use_spinner: bool = True):
                 
                 if all_games:
                     if not last_headers:
-                        from .logic import get_headers_for_position
                         last_headers = get_headers_for_position(position)
                     
                     agg = aggregate_stats(all_games, last_headers)
@@ -1830,7 +1620,6 @@ def process_query(full_query: str, use_spinner: bool = True):
                                 last_headers = gamelog['headers']
                             
                             # Check each game for threshold
-                            from .filters import check_game_threshold
                             for game in gamelog['games']:
                                 if check_game_threshold(game, last_headers, threshold_stat, threshold_value, position):
                                     matching_games.append(game)
@@ -1839,7 +1628,6 @@ def process_query(full_query: str, use_spinner: bool = True):
                     console.print(f"[green]Found {len(matching_games)} games with {val_str}+ {threshold_stat}![/green]")
                     
                     if not last_headers:
-                        from .logic import get_headers_for_position
                         last_headers = get_headers_for_position(position)
                     
                     # Show summary
@@ -1906,7 +1694,6 @@ def process_query(full_query: str, use_spinner: bool = True):
                     console.print(f"[green]Found {len(sb_games)} Super Bowl appearance(s)![/green]")
                     
                     if not last_headers:
-                        from .logic import get_headers_for_position
                         last_headers = get_headers_for_position(position)
                     
                     table = Table(title=f"Super Bowl History")
@@ -1957,8 +1744,7 @@ def process_query(full_query: str, use_spinner: bool = True):
                 last_headers = []  # Store headers from last successful gamelog
                 
                 # Get all teams for mapping
-                all_teams = get_teams()
-                teams_map = {t['abbr']: t['id'] for t in all_teams}
+                teams_map = TEAM_IDS_BY_ABBR
                 
                 if use_spinner:
                     status_ctx = console.status(f"[bold green]Searching playoff history ({years_to_check[0]}-{years_to_check[-1]})...[/bold green]")
@@ -1984,8 +1770,8 @@ def process_query(full_query: str, use_spinner: bool = True):
                                 reg_gamelog = process_player_gamelog(entity['espn_id'], check_year, season_type=2, position=position)
                                 player_team_abbr = None
                                 if reg_gamelog.get('games') and len(reg_gamelog['games']) > 0:
-                                    # Get team from first regular season game
-                                    player_team_abbr = reg_gamelog['games'][0].get('team')
+                                    # Get team from the regular season gamelog
+                                    player_team_abbr = reg_gamelog.get('team')
                                 
                                 if player_team_abbr:
                                     # Check if filter is for player's team or opponent
@@ -2101,8 +1887,7 @@ def process_query(full_query: str, use_spinner: bool = True):
                     team_data = profile_data.get('profile', {}).get('team', {})
                     team_abbr = team_data.get('abbreviation')
                 
-                teams = get_teams()
-                team = next((t for t in teams if t['abbr'] == team_abbr), None)
+                team = TEAMS_BY_ABBR.get(team_abbr)
                 
                 if not team:
                     console.print(f"[red]Could not determine team for {entity['display_name']}.[/red]")
@@ -2176,8 +1961,9 @@ def process_query(full_query: str, use_spinner: bool = True):
                     last_headers = []
                     
                     # Get all teams for mapping
-                    all_teams = get_teams()
-                    teams_map = {t['abbr']: t['id'] for t in all_teams}
+                    teams_map = TEAM_IDS_BY_ABBR
+                    target_month = (intent.get("month_filter") or "").lower()
+                    month_code = _MONTH_CODES.get(target_month)
                     
                     if use_spinner:
                         status_ctx = console.status(f"[bold green]Searching history ({years_to_check[0]}-{years_to_check[-1]})...[/bold green]")
@@ -2185,11 +1971,14 @@ def process_query(full_query: str, use_spinner: bool = True):
                         status_ctx = nullcontext()
                         
                     with status_ctx:
-                        from dateutil import parser as date_parser
+                        # Every season's gamelog is an independent request: fetch them together, then filter in order
+                        with ThreadPoolExecutor(max_workers=min(len(years_to_check), MAX_PARALLEL_FETCHES)) as pool:
+                            gamelogs = list(pool.map(
+                                lambda check_year: process_player_gamelog(entity['espn_id'], check_year, season_type=intent["season_type"], position=position),
+                                years_to_check
+                            ))
                         
-                        for check_year in years_to_check:
-                            # Regular season by default for general stats
-                            gamelog = process_player_gamelog(entity['espn_id'], check_year, season_type=intent["season_type"], position=position)
+                        for check_year, gamelog in zip(years_to_check, gamelogs):
                             if gamelog.get('games'):
                                 if gamelog.get('headers'):
                                     last_headers = gamelog['headers']
@@ -2200,9 +1989,8 @@ def process_query(full_query: str, use_spinner: bool = True):
                                     # We need a team ID to fetch schedule.
                                     # If filter_team is set, use it.
                                     # If not, we need to guess the team for this year.
-                                    # We can try to infer from the first game's 'team' field
-                                    first_game = gamelog['games'][0]
-                                    p_team_abbr = first_game.get('team', '').split('/')[0]
+                                    # We can try to infer from the gamelog's 'team' field
+                                    p_team_abbr = (gamelog.get('team') or '').split('/')[0]
                                     tid = teams_map.get(p_team_abbr)
                                     
                                     if tid:
@@ -2212,10 +2000,11 @@ def process_query(full_query: str, use_spinner: bool = True):
                                             for ev in sched['events']:
                                                 schedule_events[ev['id']] = ev
                                 
+                                # Player's team for this season type (same for every game)
+                                p_team = gamelog.get('team')
+                                
                                 for g in gamelog['games']:
                                     # Check if player's team matches filter (if specified)
-                                    p_team = g.get('team')
-                                    
                                     # Team context filter
                                     if filter_team:
                                         if not (p_team and (filter_team['abbr'] == p_team or filter_team['abbr'] in p_team)):
@@ -2230,12 +2019,9 @@ def process_query(full_query: str, use_spinner: bool = True):
                                             
                                             # Try to find team ID
                                             tid = teams_map.get(team_abbr)
-                                            if not tid:
-                                                # Try to match abbr to team list
-                                                for t in all_teams:
-                                                    if t['abbr'] == team_abbr or t['id'] == team_abbr:
-                                                        tid = t['id']
-                                                        break
+                                            if not tid and team_abbr in TEAMS_BY_ID:
+                                                # Value may already be an ESPN team id
+                                                tid = team_abbr
                                             
                                             if tid:
                                                 # We might have fetched it above, but maybe not if no time filter
@@ -2282,21 +2068,19 @@ def process_query(full_query: str, use_spinner: bool = True):
                                         if event:
                                             date_str = event.get('date')
                                             if date_str:
-                                                try:
-                                                    dt = date_parser.parse(date_str)
-                                                    
-                                                    # Month Filter
-                                                    if intent.get("month_filter"):
-                                                        if dt.strftime("%B").lower() != intent["month_filter"].lower():
-                                                            continue
-                                                    
-                                                    # Prime Time Filter
-                                                    if intent.get("prime_time"):
-                                                        # Approx check: Hour in UTC (0,1,2,3,4,23)
-                                                        if dt.hour not in [0, 1, 2, 3, 4, 23]:
-                                                            continue
-                                                except:
-                                                    pass
+                                                # Month Filter: compare the date's MM field, no parsing needed
+                                                if target_month and date_str[5:7] != month_code:
+                                                    continue
+                                                
+                                                # Prime Time Filter (an unparseable date doesn't exclude the game)
+                                                if intent.get("prime_time"):
+                                                    try:
+                                                        dt = _parse_espn_date(date_str)
+                                                    except ValueError:
+                                                        dt = None
+                                                    # Approx check: Hour in UTC (0,1,2,3,4,23)
+                                                    if dt and dt.hour not in _PRIME_HOURS:
+                                                        continue
                                             else:
                                                 # No date, skip?
                                                 continue
@@ -2310,7 +2094,6 @@ def process_query(full_query: str, use_spinner: bool = True):
                         # Aggregate
                         headers = last_headers
                         if not headers and found_games:
-                             from .logic import get_headers_for_position
                              headers = get_headers_for_position(position)
 
                         agg = aggregate_stats(found_games, headers)
@@ -2360,7 +2143,6 @@ def process_query(full_query: str, use_spinner: bool = True):
                     
                     # Try to extract year from display name if returned_season is missing
                     if not returned_season and display_name:
-                        import re
                         m = re.search(r'20\d{2}', display_name)
                         if m:
                             returned_season = int(m.group(0))
@@ -2387,7 +2169,6 @@ def process_query(full_query: str, use_spinner: bool = True):
                             
                             # Use logic.py's get_headers_for_position if headers missing
                             if not headers:
-                                from .logic import get_headers_for_position
                                 headers = get_headers_for_position(position)
                             
                             for h in headers:
@@ -2412,7 +2193,7 @@ def process_query(full_query: str, use_spinner: bool = True):
                                 "statistics": new_stats_list
                             }
                     
-                    print_player_profile(stats)
+                    print_player_profile(stats, console=console)
                 
         elif entity_type == 'team':
             if intent["week"]:
@@ -2429,7 +2210,7 @@ def process_query(full_query: str, use_spinner: bool = True):
             else:
                 # Standard team stats
                 stats = get_team_stats(entity['id'], season)
-                print_team_stats(stats)
+                print_team_stats(stats, console=console)
 
 def main():
     parser = argparse.ArgumentParser(description="NFL Stats CLI Tool")
@@ -2441,6 +2222,7 @@ def main():
         process_query(full_query)
     else:
         # Interactive Mode
+        from rich.prompt import Prompt
         console.print(Panel("[bold green]Welcome to NFL Stats CLI![/bold green]\nType your query below (or 'exit' to quit).", title="Interactive Mode"))
         
         while True:
@@ -231,7 +231,7 @@ def parse_query(query: str) -> Dict[str, Any]:
     # If no nickname found, check for official names
     if not intent["team_context"]:
         # Sort teams by length of name desc to match longer names first (e.g. "New York Giants" before "Giants")
-        teams.sort(key=lambda x: len(x['name']), reverse=True)
+        teams = sorted(teams, key=lambda x: len(x['name']), reverse=True)
         
         for team in teams:
             nickname = team['name'].split()[-1].lower()
@@ -50,8 +50,8 @@ def get_longest_play_espn(espn_id: str, player_name: str, season: int, play_type
         if not pbp or 'drives' not in pbp:
             continue
             
-        # Process drives
-        all_drives = pbp['drives'].get('previous', [])
+        # Process drives (into a new list, leaving the summary payload untouched)
+        all_drives = list(pbp['drives'].get('previous', []))
         if pbp['drives'].get('current'):
             all_drives.append(pbp['drives']['current'])
             
@@ -1,6 +1,6 @@
 from rapidfuzz import process, fuzz
 from typing import List, Dict, Optional, Tuple
-from .data import load_players, get_teams
+from .data import load_players, get_teams, TEAMS_BY_ABBR
 
 def search_player(query: str, limit: int = 5) -> List[Tuple[Dict, float]]:
     """
@@ -137,13 +137,12 @@ def search_team(query: str) -> Optional[Dict]:
     """
     Search for a team by name or abbreviation.
     """
-    teams = get_teams()
-    
     # Check for exact abbr match first
-    for team in teams:
-        if team['abbr'].lower() == query.lower():
-            return team
-            
+    team = TEAMS_BY_ABBR.get(query.upper())
+    if team:
+        return team
+    
+    teams = get_teams()
     # Fuzzy match against full names
     team_names = [t['name'] for t in teams]
     result = process.extractOne(query, team_names, scorer=fuzz.WRatio)
@@ -1,3 +1,5 @@
+import io
+import threading
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -5,7 +7,47 @@ from typing import Dict, Any, List
 
 console = Console(record=True, force_terminal=True, width=100)
 
-def print_player_profile(player_data: Dict[str, Any]):
+# Seconds of work before a DeferredStatus spinner appears
+SPINNER_DELAY = 0.2
+
+def create_recording_console() -> Console:
+    """
+    Create a private recording console (same settings as the CLI console)
+    that writes to memory, so concurrent API requests never share a buffer.
+    """
+    return Console(record=True, force_terminal=True, width=100, file=io.StringIO())
+
+class DeferredStatus:
+    """
+    A console.status spinner that only starts once the work has run for `delay` seconds,
+    so cached/local queries finish without launching Rich's live-display refresh thread.
+    """
+    def __init__(self, console: Console, status: str, delay: float = SPINNER_DELAY):
+        self._status = console.status(status)
+        self._timer = threading.Timer(delay, self._start)
+        self._timer.daemon = True
+        self._lock = threading.Lock()
+        self._started = False
+        self._done = False
+    
+    def _start(self):
+        with self._lock:
+            if not self._done:
+                self._status.start()
+                self._started = True
+    
+    def __enter__(self):
+        self._timer.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._timer.cancel()
+        with self._lock:
+            self._done = True
+            if self._started:
+                self._status.stop()
+
+def print_player_profile(player_data: Dict[str, Any], console: Console = console):
     """
     Print a player's profile and stats.
     """
@@ -45,7 +87,7 @@ def print_player_profile(player_data: Dict[str, Any]):
     
     console.print(table)
 
-def print_team_stats(team_data: Dict[str, Any]):
+def print_team_stats(team_data: Dict[str, Any], console: Console = console):
     """
     Print team stats.
     """